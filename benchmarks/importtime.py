@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""
+Import time budget of the model field path, see benchmarks/README.md. Exits with 1 if importing the LinkField takes
+longer than the budget or imports a module which should only be loaded on demand.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULE = 'linkit.model_fields'
+
+# Imported by the types, widgets and admin, never by the model field itself
+FORBIDDEN = ('cms', 'filer', 'pkg_resources', 'linkit.widgets', 'linkit.form_fields', 'linkit.admin',
+             'linkit.types.page', 'linkit.types.file', 'linkit.types.model')
+
+
+def importtime(module: str) -> dict:
+    """ Self and cumulative import time in microseconds per module, as reported by python -X importtime. """
+    code = 'from django.conf import settings; settings.configure(); import {}'.format(module)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT_DIR, capture_output=True,
+                            text=True, check=True)
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        try:
+            modules[parts[2].strip()] = {'self': int(parts[0]), 'cumulative': int(parts[1])}
+        except (IndexError, ValueError):
+            # Header line
+            continue
+
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--budget', type=float, default=30, help='Milliseconds for importing the linkit modules')
+    options = parser.parse_args()
+
+    modules = importtime(MODULE)
+    own = sum(times['self'] for name, times in modules.items() if name.split('.')[0] == 'linkit') / 1000
+    forbidden = sorted(name for name in modules if name.split('.')[0] in FORBIDDEN or name in FORBIDDEN)
+
+    print(json.dumps({
+        'module': MODULE,
+        'linkit_ms': round(own, 2),
+        'cumulative_ms': round(modules[MODULE]['cumulative'] / 1000, 2),
+        'budget_ms': options.budget,
+        'forbidden': forbidden,
+    }, indent=2))
+
+    if forbidden or own > options.budget:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
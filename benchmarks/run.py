@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+"""
+Benchmark suite for LinkIt, see benchmarks/README.md. Prints (or writes) a JSON report.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+
+# The benchmarks use the app of the tests, see benchmarks/settings.py
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'benchmarks.settings')
+
+
+@contextmanager
+def measure(result: dict, queries: bool = True):
+    """ Store the duration and the number of queries of the block in the given dict. """
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    context = CaptureQueriesContext(connection)
+    started = time.perf_counter()
+    with context:
+        yield
+    result['seconds'] = time.perf_counter() - started
+    if queries:
+        result['queries'] = len(context.captured_queries)
+
+
+def setup(options):
+    import django
+    from django.core.management import call_command
+
+    django.setup()
+    call_command('migrate', run_syncdb=True, verbosity=0)
+    create_fixtures(options)
+
+
+def create_fixtures(options):
+    from django.contrib.auth import get_user_model
+    from django.core.files.base import ContentFile
+    from cms.api import create_page
+    from filer.models import File
+
+    from tests.testapp.models import News, Teaser
+    from linkit.link import Link
+
+    user = get_user_model().objects.create_superuser('bench', 'bench@example.com', 'bench')
+    pages = [create_page('Page {}'.format(index), 'test.html', 'en', created_by=user).pk
+             for index in range(options.pages)]
+    files = [File.objects.create(file=ContentFile(b'linkit', name='file-{}.txt'.format(index)),
+                                 original_filename='file-{}.txt'.format(index)).pk
+             for index in range(options.files)]
+    news = [news.pk for news in News.objects.bulk_create(
+        [News(title='News {}'.format(index)) for index in range(options.news)])]
+
+    config = Teaser._meta.get_field('link').config
+    values = [
+        ('page', 'page', pages),
+        ('file', 'file', files),
+        ('news', 'model', news),
+        ('input', 'input', ['https://example.com/{}'.format(index) for index in range(100)]),
+    ]
+    teasers = []
+    for index in range(options.rows):
+        identifier, key, targets = values[index % len(values)]
+        data = {'type': identifier, 'value': {key: targets[index % len(targets)]}, 'no_follow': index % 2 == 0}
+        teasers.append(Teaser(title='Teaser {}'.format(index), link=Link(config=config, data=data, name='link')))
+
+    Teaser.objects.bulk_create(teasers, batch_size=500)
+
+
+def bench_parse(options) -> dict:
+    from tests.testapp.models import Teaser
+
+    fetch, access = {}, {}
+    with measure(fetch):
+        teasers = list(Teaser.objects.all())
+    with measure(access):
+        for teaser in teasers:
+            teaser.link.data('type')
+
+    return {
+        'rows': len(teasers),
+        'fetch': fetch,
+        'access': access,
+        'rows_per_second': len(teasers) / (fetch['seconds'] + access['seconds']),
+    }
+
+
+def bench_resolve(options) -> dict:
+    from tests.testapp.models import Teaser
+
+    result = {}
+    for name, queryset in [('plain', Teaser.objects.all()), ('prefetched', Teaser.objects.prefetch_links('link'))]:
+        timings = []
+        total = {}
+        with measure(total):
+            for teaser in queryset[:options.resolve_rows]:
+                started = time.perf_counter()
+                teaser.link.resolve()
+                timings.append(time.perf_counter() - started)
+
+        result[name] = {
+            'links': len(timings),
+            'seconds': total['seconds'],
+            'queries': total['queries'],
+            'queries_per_link': total['queries'] / len(timings) if timings else 0,
+            'latency_median': statistics.median(timings) if timings else 0,
+            'latency_max': max(timings) if timings else 0,
+        }
+
+    return result
+
+
+def bench_widget(options) -> dict:
+    from linkit.link import Link
+    from linkit.scope import request_scope
+    from linkit.widgets import LinkWidget
+
+    all_types = ['input', 'page', 'file', 'news']
+    result = []
+    for type_count in range(1, len(all_types) + 1):
+        config = {'types': all_types[:type_count], 'allow_target': True, 'allow_label': True,
+                  'allow_no_follow': True, 'snapshot': False, 'native_json': False}
+        widget = LinkWidget(config=config)
+        for inlines in options.inlines:
+            entry = {'types': type_count, 'inlines': inlines}
+            with request_scope(), measure(entry):
+                for index in range(inlines):
+                    name = 'form-{}-link'.format(index)
+                    widget.render(name, Link(config=config, name=name))
+            entry['seconds_per_widget'] = entry['seconds'] / inlines
+            result.append(entry)
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pages', type=int, default=100)
+    parser.add_argument('--files', type=int, default=100)
+    parser.add_argument('--news', type=int, default=100)
+    parser.add_argument('--rows', type=int, default=2000, help='Rows holding links')
+    parser.add_argument('--resolve-rows', type=int, default=200, help='Links resolved per resolve benchmark')
+    parser.add_argument('--inlines', type=int, nargs='+', default=[1, 10, 50])
+    parser.add_argument('--output', help='Write the JSON report to this file')
+    options = parser.parse_args()
+
+    setup(options)
+
+    import django
+    from django.utils import translation
+    from linkit.__version__ import __version__
+
+    with translation.override('en'):
+        report = {
+            'meta': {
+                'linkit': __version__,
+                'django': django.get_version(),
+                'python': platform.python_version(),
+                'options': vars(options),
+            },
+            'parse': bench_parse(options),
+            'resolve': bench_resolve(options),
+            'widget': bench_widget(options),
+        }
+
+    output = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+import os
+import tempfile
+
+from tests.settings import *  # noqa: F401, F403
+
+# The benchmarks share the app of the tests, but run against a database file and with the middleware of a site
+TMP_DIR = tempfile.mkdtemp(prefix='linkit-bench-')
+
+SECRET_KEY = 'benchmarks'
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.path.join(TMP_DIR, 'bench.sqlite3'),
+    }
+}
+
+MIDDLEWARE = [
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.locale.LocaleMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'cms.middleware.user.CurrentUserMiddleware',
+    'cms.middleware.page.CurrentPageMiddleware',
+    'cms.middleware.toolbar.ToolbarMiddleware',
+    'cms.middleware.language.LanguageCookieMiddleware',
+    'linkit.middleware.LinkitMiddleware',
+]
+
+LANGUAGES = [('en', 'English')]
+
+MEDIA_ROOT = os.path.join(TMP_DIR, 'media')
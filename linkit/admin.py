@@ -0,0 +1,147 @@
+from django.contrib import messages
+from django.contrib.admin import SimpleListFilter
+from django.contrib.admin.utils import unquote
+from django.contrib.admin.views.main import ChangeList
+from django.db import connections, router
+from django.utils.translation import gettext as _, gettext_lazy
+
+from linkit.models import LinkReference
+from linkit.querysets import prefetch_links
+from linkit.types.manager import type_manager
+
+LINK_COLUMNS = {
+    'type': gettext_lazy('Link type'),
+    'label': gettext_lazy('Link label'),
+    'href': gettext_lazy('Link url'),
+    'broken': gettext_lazy('Broken link'),
+}
+
+
+class LinkReferenceAdminMixin(object):
+    """ ModelAdmin mixin warning on the delete page if other objects still link to the object. """
+
+    def delete_view(self, request, object_id, extra_context=None):
+        if request.method == 'GET':
+            obj = self.get_object(request, unquote(object_id))
+            if obj is not None:
+                references = LinkReference.objects.to(obj).select_related('source_type')
+                count = references.count()
+                if count:
+                    sources = ', '.join(str(reference.source) for reference in references[:10])
+                    messages.warning(request, _('%(count)s link(s) still point to this object: %(sources)s') % {
+                        'count': count,
+                        'sources': sources,
+                    })
+
+        return super().delete_view(request, object_id, extra_context)
+
+
+def link_column(field_name: str, attribute: str, description: str = None):
+    """
+    A list_display column showing the type, label, href or broken state of the link in the given field. Used by the
+    LinkAdminMixin, which resolves the links of all rows of the page at once.
+    """
+    if attribute not in LINK_COLUMNS:
+        raise ValueError('Unknown link column "{}", use one of {}'.format(attribute, ', '.join(LINK_COLUMNS)))
+
+    def column(obj):
+        link = getattr(obj, field_name)
+        if not link or not link.data('type'):
+            return False if attribute == 'broken' else None
+
+        registered = link.data('type') in type_manager
+        if attribute == 'type':
+            return type_manager.get(link.data('type')).type_label if registered else link.data('type')
+        if attribute == 'broken':
+            return link.set and (not registered or not link.value)
+
+        return getattr(link.resolve(), attribute)
+
+    column.short_description = description or LINK_COLUMNS[attribute]
+    column.boolean = attribute == 'broken'
+    column.link_field = field_name
+    column.__name__ = '{}_{}'.format(field_name, attribute)
+    return column
+
+
+def link_type_filter(field_name: str):
+    """ list_filter by the link type of the given field, evaluated in the database. """
+
+    class LinkTypeFilter(SimpleListFilter):
+        title = gettext_lazy('Link type')
+        parameter_name = '{}_type'.format(field_name)
+
+        def lookups(self, request, model_admin):
+            return type_manager.type_choices(model_admin.model._meta.get_field(field_name).config['types'])
+
+        def queryset(self, request, queryset):
+            if self.value():
+                return queryset.filter(**{'{}__type'.format(field_name): self.value()})
+
+            return queryset
+
+    return LinkTypeFilter
+
+
+def link_set_filter(field_name: str):
+    """
+    list_filter by set / not set of the given field, evaluated in the database. The isset lookup only exists on
+    PostgreSQL and SQLite, on other databases the filter is hidden.
+    """
+
+    class LinkSetFilter(SimpleListFilter):
+        title = gettext_lazy('Link set')
+        parameter_name = '{}_set'.format(field_name)
+
+        def lookups(self, request, model_admin):
+            if connections[router.db_for_read(model_admin.model)].vendor not in ('postgresql', 'sqlite'):
+                return None
+
+            return [('yes', _('Yes')), ('no', _('No'))]
+
+        def queryset(self, request, queryset):
+            if self.value() not in ('yes', 'no'):
+                return queryset
+
+            return queryset.filter(**{'{}__isset'.format(field_name): self.value() == 'yes'})
+
+    return LinkSetFilter
+
+
+class LinkChangeList(ChangeList):
+    """ ChangeList resolving the links of all link columns of the current page with one query per link type. """
+
+    def get_results(self, request):
+        super().get_results(request)
+        fields = {column.link_field for column in self.list_display if hasattr(column, 'link_field')}
+        if fields:
+            # Resolves the links of the cached instances, result_list has to stay a queryset for list_editable
+            prefetch_links(self.result_list, *fields)
+
+
+class LinkAdminMixin(object):
+    """
+    ModelAdmin mixin for models with LinkFields. Columns listed in link_columns as 'field.attribute' (type, label,
+    href or broken) are added to list_display, the fields in link_filters get a filter by link type and by set / not
+    set. The links of a changelist page are resolved at once, so 100 rows cost a constant number of queries.
+    """
+    link_columns = ()
+    link_filters = ()
+
+    def get_list_display(self, request):
+        list_display = list(super().get_list_display(request))
+        for column in self.link_columns:
+            field_name, attribute = column.split('.')
+            list_display.append(link_column(field_name, attribute))
+
+        return list_display
+
+    def get_list_filter(self, request):
+        list_filter = list(super().get_list_filter(request))
+        for field_name in self.link_filters:
+            list_filter += [link_type_filter(field_name), link_set_filter(field_name)]
+
+        return list_filter
+
+    def get_changelist(self, request, **kwargs):
+        return LinkChangeList
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class LinkitConfig(AppConfig):
     name = 'linkit'
+    default_auto_field = 'django.db.models.AutoField'
+
+    def ready(self):
+        from linkit import receivers  # noqa: F401
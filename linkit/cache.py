@@ -0,0 +1,136 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.translation import get_language
+
+# Marker for cache misses, since None or False are valid cached values
+MISSING = object()
+
+
+class ResolutionCache(object):
+    """
+    Opt-in cache for resolved link data (e.g. href and label) keyed by (type identifier, target pk, language). The
+    first tier is a bounded in-process LRU, the second one a Django cache. Enable it with the setting:
+
+    LINKIT_CACHE = {
+        'SIZE': 1000,        # Max entries in the in-process LRU
+        'LOCAL_TIMEOUT': 60, # Seconds an entry lives in the in-process LRU
+        'TIMEOUT': 300,      # Seconds an entry lives in the Django cache
+        'BACKEND': 'default' # Django cache alias or None to only use the in-process LRU
+    }
+    """
+
+    def __init__(self, namespace: str = 'linkit', setting: str = 'LINKIT_CACHE', per_language: bool = True):
+        self.namespace = namespace
+        self.setting = setting
+        self.per_language = per_language
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    def option(self, name: str, default=None):
+        return (getattr(settings, self.setting, None) or {}).get(name, default)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(getattr(settings, self.setting, None))
+
+    @property
+    def shared(self):
+        alias = self.option('BACKEND', 'default')
+        return caches[alias] if alias else None
+
+    def key(self, identifier: str, pk, language: Optional[str] = None) -> str:
+        if not self.per_language:
+            return '{}:{}:{}'.format(self.namespace, identifier, pk)
+
+        return '{}:{}:{}:{}'.format(self.namespace, identifier, pk,
+                                    language or get_language() or settings.LANGUAGE_CODE)
+
+    def get(self, identifier: str, pk):
+        """ Returns the cached value or MISSING. """
+        key = self.key(identifier, pk)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is not None and entry[0] > now:
+                self._local.move_to_end(key)
+                self.local_hits += 1
+                return entry[1]
+
+        value = self.shared.get(key, MISSING) if self.shared else MISSING
+        if value is MISSING:
+            with self._lock:
+                self.misses += 1
+        else:
+            with self._lock:
+                self.shared_hits += 1
+            self._set_local(key, value, now)
+
+        return value
+
+    def set(self, identifier: str, pk, value, timeout: Optional[int] = None):
+        """ Store the value, a timeout limits the lifetime in both tiers. """
+        key = self.key(identifier, pk)
+        self._set_local(key, value, time.monotonic(), timeout)
+        if self.shared:
+            shared_timeout = self.option('TIMEOUT', 300)
+            self.shared.set(key, value, shared_timeout if timeout is None else min(timeout, shared_timeout))
+
+    def _set_local(self, key: str, value, now: float, timeout: Optional[int] = None):
+        local_timeout = self.option('LOCAL_TIMEOUT', 60)
+        if timeout is not None:
+            local_timeout = min(timeout, local_timeout)
+
+        with self._lock:
+            self._local[key] = (now + local_timeout, value)
+            self._local.move_to_end(key)
+            while len(self._local) > self.option('SIZE', 1000):
+                self._local.popitem(last=False)
+
+    def invalidate(self, identifier: str, pks: Iterable):
+        """ Remove the entries of the given targets in all languages. """
+        languages = [None]
+        if self.per_language:
+            # Keys without an active language use the LANGUAGE_CODE, see key()
+            languages = {code for code, name in settings.LANGUAGES} | {settings.LANGUAGE_CODE}
+        keys = [self.key(identifier, pk, language) for pk in pks for language in languages]
+        if not keys:
+            return
+
+        with self._lock:
+            for key in keys:
+                self._local.pop(key, None)
+
+        if self.shared:
+            self.shared.delete_many(keys)
+
+    def clear(self):
+        """ Clears the in-process LRU and the counters. The Django cache entries expire on their own. """
+        with self._lock:
+            self._local.clear()
+            self.local_hits = self.shared_hits = self.misses = 0
+
+    def stats(self) -> dict:
+        """ Hit/miss counters to size the cache. """
+        with self._lock:
+            size, local_hits, shared_hits, misses = len(self._local), self.local_hits, self.shared_hits, self.misses
+
+        total = local_hits + shared_hits + misses
+        return {
+            'size': size,
+            'local_hits': local_hits,
+            'shared_hits': shared_hits,
+            'misses': misses,
+            'hit_ratio': (local_hits + shared_hits) / total if total else 0.0,
+        }
+
+
+resolution_cache = ResolutionCache()
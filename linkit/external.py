@@ -0,0 +1,315 @@
+import asyncio
+import hashlib
+import ssl
+import statistics
+import time
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+from django.conf import settings
+from django.utils import timezone
+
+from linkit.utils import chunked, link_fields
+
+USER_AGENT = 'linkit-checker/1.0'
+
+# HEAD isn't supported by every server, these get a GET instead
+HEAD_NOT_ALLOWED = (405, 501)
+
+
+def recheck_interval() -> timedelta:
+    """ External links checked more recently than LINKIT_EXTERNAL_RECHECK seconds (default: a week) are skipped. """
+    return timedelta(seconds=getattr(settings, 'LINKIT_EXTERNAL_RECHECK', 60 * 60 * 24 * 7))
+
+
+def url_key(url: str) -> str:
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+
+def input_urls(fields: list = None, chunk_size: int = 2000) -> Iterator[str]:
+    """
+    Stream the distinct http(s) urls of all input links of the given (default: all) LinkFields. Only the links of
+    type input are read from the database, chunk by chunk.
+    """
+    seen = set()
+    for model, field in fields or link_fields():
+        if 'input' not in field.config['types']:
+            continue
+
+        links = model._default_manager.filter(**{f'{field.attname}__type': 'input'}).values_list(field.attname,
+                                                                                                 flat=True)
+        for link in links.iterator(chunk_size=chunk_size):
+            value = link.data('value') if link else None
+            url = (value.get('input') or '').strip() if isinstance(value, dict) else ''
+            if url.lower().startswith(('http://', 'https://')) and url not in seen:
+                seen.add(url)
+                yield url
+
+
+def due_urls(urls: Iterable[str], interval: timedelta = None, chunk_size: int = 2000) -> Iterator[str]:
+    """ The urls which weren't checked within the recheck interval. """
+    from linkit.models import ExternalLinkCheck
+
+    threshold = timezone.now() - (interval if interval is not None else recheck_interval())
+    for chunk in chunked(urls, chunk_size):
+        recent = set(ExternalLinkCheck.objects.filter(
+            key__in=[url_key(url) for url in chunk], checked_at__gte=threshold,
+        ).values_list('key', flat=True))
+        yield from (url for url in chunk if url_key(url) not in recent)
+
+
+class CheckResult(NamedTuple):
+    url: str
+    status: Optional[int]    # None if the request failed
+    error: str
+    seconds: float
+
+    @property
+    def ok(self) -> bool:
+        return self.status is not None and self.status < 400
+
+
+class CheckReport(NamedTuple):
+    results: List[CheckResult]
+    seconds: float
+
+    @property
+    def broken(self) -> List[CheckResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def urls_per_second(self) -> float:
+        return len(self.results) / self.seconds if self.seconds else 0.0
+
+    def host_latency(self) -> Dict[str, dict]:
+        """ Number of requests and latency (avg, p95, max in seconds) per host. """
+        by_host = defaultdict(list)
+        for result in self.results:
+            by_host[urlsplit(result.url).hostname or ''].append(result.seconds)
+
+        latency = {}
+        for host, seconds in sorted(by_host.items()):
+            seconds = sorted(seconds)
+            latency[host] = {
+                'requests': len(seconds),
+                'avg': statistics.mean(seconds),
+                'p95': seconds[min(len(seconds) - 1, int(len(seconds) * 0.95))],
+                'max': seconds[-1],
+            }
+
+        return latency
+
+    def summary(self) -> dict:
+        return {
+            'urls': len(self.results),
+            'broken': len(self.broken),
+            'seconds': self.seconds,
+            'urls_per_second': self.urls_per_second,
+            'hosts': self.host_latency(),
+        }
+
+
+class HostPool(object):
+    """
+    Keep-alive connections to one host. At most `size` requests run at once and they're started at most `rate`
+    times per second.
+    """
+
+    def __init__(self, scheme: str, host: str, port: int, size: int, rate: Optional[float],
+                 ssl_context: Optional[ssl.SSLContext] = None):
+        self.scheme = scheme
+        self.ssl_context = ssl_context
+        self.host = host
+        self.port = port
+        self.semaphore = asyncio.Semaphore(size)
+        self.interval = 1 / rate if rate else 0
+        self.next_start = 0.0
+        self.idle = []
+
+    async def _wait_turn(self):
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        start = max(now, self.next_start)
+        self.next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def _connect(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if self.scheme == 'https':
+            return await asyncio.open_connection(self.host, self.port, ssl=self.ssl_context or True,
+                                                 server_hostname=self.host)
+
+        return await asyncio.open_connection(self.host, self.port)
+
+    async def _send(self, connection: tuple, method: str, target: str) -> Tuple[int, bool]:
+        """ Send the request and read the status and headers, returns the status and if we can keep the connection. """
+        reader, writer = connection
+        host = self.host if self.port in (80, 443) else '{}:{}'.format(self.host, self.port)
+        writer.write((
+            '{} {} HTTP/1.1\r\nHost: {}\r\nUser-Agent: {}\r\nAccept: */*\r\nConnection: {}\r\n\r\n'.format(
+                method, target, host, USER_AGENT, 'keep-alive' if method == 'HEAD' else 'close')
+        ).encode('latin-1'))
+        await writer.drain()
+
+        keep_alive = method == 'HEAD'
+        while True:
+            status_line = await reader.readline()
+            if not status_line:
+                raise ConnectionError('Connection closed by the server')
+            status = int(status_line.split()[1])
+
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                if name.strip().lower() == 'connection' and value.strip().lower() == 'close':
+                    keep_alive = False
+
+            # Interim responses (e.g. 100 Continue or 103 Early Hints) are followed by the final one
+            if status >= 200:
+                return status, keep_alive
+
+    async def request(self, method: str, target: str, timeout: float) -> int:
+        async with self.semaphore:
+            await self._wait_turn()
+
+            # Idle connections may have been closed by the server in the meantime, so retry once with a new one
+            reused = bool(self.idle)
+            connection = self.idle.pop() if reused else None
+            for attempt in range(2):
+                if connection is None:
+                    connection = await asyncio.wait_for(self._connect(), timeout)
+                try:
+                    status, keep_alive = await asyncio.wait_for(self._send(connection, method, target), timeout)
+                except (ConnectionError, ValueError, IndexError):
+                    connection[1].close()
+                    connection = None
+                    if not reused or attempt:
+                        raise
+                    continue
+                except BaseException:
+                    connection[1].close()
+                    raise
+
+                if keep_alive:
+                    self.idle.append(connection)
+                else:
+                    connection[1].close()
+                return status
+
+    def close(self):
+        for reader, writer in self.idle:
+            writer.close()
+        self.idle = []
+
+
+class ExternalLinkChecker(object):
+    """
+    Check urls concurrently with asyncio and the stdlib only: a HEAD request per url (GET if HEAD isn't allowed), a
+    connection pool per host, a rate limit per host and a timeout per request. Redirects aren't followed, they count
+    as ok.
+    """
+
+    def __init__(self, concurrency: int = 50, per_host: int = 4, rate: Optional[float] = 5, timeout: float = 10):
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.rate = rate
+        self.timeout = timeout
+        self.pools = {}
+        self._ssl_context = None
+
+    @property
+    def ssl_context(self) -> ssl.SSLContext:
+        """ One context for all https connections of the checker, loading the CA certificates is expensive. """
+        if self._ssl_context is None:
+            self._ssl_context = ssl.create_default_context()
+
+        return self._ssl_context
+
+    def pool(self, scheme: str, host: str, port: int) -> HostPool:
+        key = (scheme, host, port)
+        if key not in self.pools:
+            self.pools[key] = HostPool(scheme, host, port, self.per_host, self.rate,
+                                       self.ssl_context if scheme == 'https' else None)
+
+        return self.pools[key]
+
+    async def check(self, url: str) -> CheckResult:
+        started = time.perf_counter()
+        try:
+            parts = urlsplit(url)
+            if not parts.hostname:
+                raise ValueError('No host in url')
+            port = parts.port or (443 if parts.scheme == 'https' else 80)
+            host = parts.hostname.encode('idna').decode('ascii')
+            target = quote(parts.path or '/', safe="/%:@!$&'()*+,;=~-._") + (
+                '?' + quote(parts.query, safe="/%:@!$&'()*+,;=?~-._") if parts.query else '')
+
+            pool = self.pool(parts.scheme, host, port)
+            status = await pool.request('HEAD', target, self.timeout)
+            if status in HEAD_NOT_ALLOWED:
+                status = await pool.request('GET', target, self.timeout)
+        except asyncio.TimeoutError:
+            return CheckResult(url, None, 'Timeout', time.perf_counter() - started)
+        except (OSError, ValueError, IndexError) as e:
+            return CheckResult(url, None, '{}: {}'.format(type(e).__name__, e)[:255], time.perf_counter() - started)
+
+        return CheckResult(url, status, '', time.perf_counter() - started)
+
+    async def run(self, urls: Iterable[str]) -> CheckReport:
+        """ Check all urls, at most `concurrency` at once. The urls are consumed as the workers need them. """
+        started = time.perf_counter()
+        urls = iter(urls)
+        results = []
+
+        async def worker():
+            # Workers take turns on the shared iterator, next() never awaits so it isn't called concurrently
+            for url in urls:
+                results.append(await self.check(url))
+
+        try:
+            await asyncio.gather(*[worker() for index in range(self.concurrency)])
+        finally:
+            for pool in self.pools.values():
+                pool.close()
+            # The pools belong to this event loop
+            self.pools = {}
+
+        return CheckReport(results, time.perf_counter() - started)
+
+
+def save_results(results: Iterable[CheckResult], chunk_size: int = 500):
+    """ Store the results, replacing the previous check of the same url. """
+    from linkit.models import ExternalLinkCheck
+
+    now = timezone.now()
+    for chunk in chunked(results, chunk_size):
+        ExternalLinkCheck.objects.bulk_create([
+            ExternalLinkCheck(key=url_key(result.url), url=result.url, status=result.status, error=result.error,
+                              ok=result.ok, seconds=result.seconds, checked_at=now)
+            for result in chunk
+        ], update_conflicts=True, unique_fields=['key'],
+            update_fields=['url', 'status', 'error', 'ok', 'seconds', 'checked_at'])
+
+
+def check_external_links(fields: list = None, checker: ExternalLinkChecker = None, interval: timedelta = None,
+                         save: bool = True, chunk_size: int = 2000) -> CheckReport:
+    """
+    Check the input links of all LinkFields which weren't checked within the recheck interval and store the results
+    in ExternalLinkCheck. Every url is only checked once, no matter how many rows link to it. The urls are read and
+    checked chunk by chunk, since the database can't be queried from within the event loop.
+    """
+    checker = checker or ExternalLinkChecker()
+    results = []
+    seconds = 0.0
+    for urls in chunked(due_urls(input_urls(fields), interval), chunk_size):
+        report = asyncio.run(checker.run(urls))
+        if save:
+            save_results(report.results)
+        results += report.results
+        seconds += report.seconds
+
+    return CheckReport(results, seconds)
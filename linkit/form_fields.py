@@ -1,6 +1,8 @@
-from django.forms import forms
+from django.forms import BaseInlineFormSet, forms
 
 from linkit.link import Link
+from linkit.scope import ensure_scope
+from linkit.types.validation import preload_targets
 from linkit.widgets import LinkWidget
 
 
@@ -29,6 +31,32 @@ class LinkFormField(forms.Field):
             for key, error in form.errors.as_data().items():
                 raise error[0]
         else:
-            value._data['value'] = form.cleaned_data
+            value.set_data('value', form.cleaned_data)
 
         return value
+
+
+class LinkFormSetMixin(object):
+    """
+    Formset mixin validating the links of all forms with one query per link type, instead of one (or more) per
+    link. Without it, saving an inline with 100 links runs hundreds of queries.
+    """
+
+    def submitted_links(self) -> list:
+        links = []
+        for form in self.forms:
+            for name, field in form.fields.items():
+                if isinstance(field, LinkFormField):
+                    links.append(field.widget.value_from_datadict(form.data, form.files, form.add_prefix(name)))
+
+        return links
+
+    def full_clean(self):
+        with ensure_scope():
+            if self.is_bound:
+                preload_targets(self.submitted_links())
+            super().full_clean()
+
+
+class LinkInlineFormSet(LinkFormSetMixin, BaseInlineFormSet):
+    """ Use as formset of admin inlines with LinkFields. """
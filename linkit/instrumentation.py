@@ -0,0 +1,119 @@
+import logging
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+from django.dispatch import Signal
+
+logger = logging.getLogger('linkit')
+
+# Sent after every instrumented call with the Resolution as record argument
+link_resolved = Signal()
+
+_tracker = ContextVar('linkit_tracker', default=None)
+
+
+class Resolution(NamedTuple):
+    kind: str                  # real_value, href, label or widget
+    identifier: Optional[str]  # Link type identifier
+    pk: Optional[str]          # Target pk
+    seconds: float
+    cache: Optional[str]       # None if no cache was involved, otherwise e.g. hit, miss or snapshot
+
+
+class LinkStats(object):
+    """ All resolutions recorded by track_links. """
+
+    def __init__(self):
+        self.records = []
+
+    def add(self, record: Resolution):
+        self.records.append(record)
+
+    @property
+    def lookups(self) -> list:
+        """ Real values which were actually loaded, opposing to the ones taken from the link or a cache. """
+        return [record for record in self.records
+                if record.kind == 'real_value' and record.cache not in ('hit', 'identity')]
+
+    def duplicates(self) -> dict:
+        """ Targets loaded more than once: {(identifier, pk): count} """
+        counter = Counter((record.identifier, record.pk) for record in self.lookups)
+        return {target: count for target, count in counter.items() if count > 1}
+
+    def by_type(self) -> dict:
+        result = defaultdict(lambda: {'count': 0, 'seconds': 0.0})
+        for record in self.lookups:
+            result[record.identifier]['count'] += 1
+            result[record.identifier]['seconds'] += record.seconds
+
+        return dict(result)
+
+    def summary(self) -> dict:
+        by_type = self.by_type()
+        cache = Counter(record.cache for record in self.records if record.cache)
+        return {
+            'resolutions': len(self.lookups),
+            'seconds': sum(record.seconds for record in self.lookups),
+            'duplicates': sum(count - 1 for count in self.duplicates().values()),
+            'cache': dict(cache),
+            'widgets': sum(1 for record in self.records if record.kind == 'widget'),
+            'slowest_types': sorted(by_type, key=lambda identifier: by_type[identifier]['seconds'], reverse=True)[:3],
+        }
+
+    def check_budget(self, name: str = ''):
+        """ Log a warning if more targets were loaded than the LINKIT_RESOLUTION_BUDGET allows. """
+        budget = getattr(settings, 'LINKIT_RESOLUTION_BUDGET', None)
+        if budget is not None and len(self.lookups) > budget:
+            logger.warning('linkit resolution budget of %s exceeded in %s: %s', budget, name or 'unknown',
+                           self.summary())
+
+
+@contextmanager
+def track_links():
+    """ Record all link resolutions within the block, yields a LinkStats object. """
+    stats = LinkStats()
+    token = _tracker.set(stats)
+    try:
+        yield stats
+    finally:
+        _tracker.reset(token)
+
+
+def _active() -> bool:
+    return _tracker.get() is not None or link_resolved.has_listeners()
+
+
+def record(kind: str, identifier: Optional[str], pk=None, seconds: float = 0.0, cache: Optional[str] = None):
+    """ Record a resolution, used by instrument and for calls which don't need to be timed. """
+    if _active():
+        _emit(Resolution(kind, identifier, None if pk is None else str(pk), seconds, cache))
+
+
+@contextmanager
+def instrument(kind: str, identifier: Optional[str], pk=None):
+    """
+    Time the block and record it. The yielded dict can be used to set the cache state, e.g. info['cache'] = 'hit'.
+    Does nothing if no one is listening.
+    """
+    info = {'cache': None}
+    if not _active():
+        yield info
+        return
+
+    started = time.perf_counter()
+    try:
+        yield info
+    finally:
+        record(kind, identifier, pk, time.perf_counter() - started, info['cache'])
+
+
+def _emit(resolution: Resolution):
+    stats = _tracker.get()
+    if stats is not None:
+        stats.add(resolution)
+
+    link_resolved.send(sender=None, record=resolution)
@@ -1,22 +1,183 @@
 import json
-from typing import Optional
+import time
+from typing import NamedTuple, Optional
 
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+from django.conf import settings
+from django.forms.utils import flatatt
+from django.utils import translation
+from django.utils.html import format_html
+
+from linkit.cache import MISSING, resolution_cache
+from linkit.instrumentation import instrument
+from linkit.scope import identity_map
+from linkit.types.contracts import UNRESOLVED
 from linkit.types.manager import type_manager
 
 
+DATA_KEYS = ('type', 'value', 'label', 'target', 'no_follow')
+
+
+def snapshot_max_age() -> Optional[int]:
+    """ Seconds a snapshot of href and label is trusted. None trusts them forever. """
+    return getattr(settings, 'LINKIT_SNAPSHOT_MAX_AGE', 60 * 60 * 24)
+
+
+class ResolvedLink(NamedTuple):
+    """ Everything needed to render a link, resolved at once by Link.resolve(). """
+    href: Optional[str]
+    label: Optional[str]
+    target: str
+    rel: str
+    external: bool
+
+    def as_html(self, **attrs) -> str:
+        """ Render the anchor tag, or just the label if the target is missing. """
+        if not self.href:
+            return format_html('{}', self.label or '')
+
+        attrs = {'href': self.href, 'target': self.target, 'rel': self.rel or None, **attrs}
+        return format_html('<a{}>{}</a>', flatatt({key: value for key, value in attrs.items() if value}),
+                           self.label or self.href)
+
+
+class LinkData(dict):
+    """
+    The parsed json of a link. Every write, also to nested dicts like the value, marks the link as changed and
+    resets its memoized values, so writing to link.data() directly is as safe as set_data. Copies and pickles are
+    plain dicts, the Link wraps them again.
+    """
+    __slots__ = ('_link', '_key')
+
+    def __init__(self, link: 'Link', data: dict, key: Optional[str] = None):
+        super().__init__({name: self._wrap(link, key or name, value) for name, value in data.items()})
+        self._link = link
+        # The top level key of nested dicts
+        self._key = key
+
+    @staticmethod
+    def _wrap(link: 'Link', key: str, value):
+        return LinkData(link, value, key) if type(value) is dict else value
+
+    def plain(self) -> dict:
+        """ Untracked copy of the data. """
+        return {name: value.plain() if isinstance(value, LinkData) else value for name, value in self.items()}
+
+    def _changed(self, key: Optional[str] = None):
+        self._link._data_changed(self._key or key)
+
+    def __reduce__(self):
+        return dict, (self.plain(),)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, self._wrap(self._link, self._key or key, value))
+        self._changed(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed(key)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            super().__setitem__(key, self._wrap(self._link, self._key or key, value))
+        self._changed()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+
+        return self[key]
+
+    def pop(self, key, *default):
+        changed = key in self
+        value = super().pop(key, *default)
+        if changed:
+            self._changed(key)
+
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._changed(item[0])
+        return item
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+
 class Link(object):
-    def __init__(self, config: dict, data: dict = None, name: str = None):
-        data = data or {}
+    # Links get instantiated for every row fetched, so keep them as small as possible
+    __slots__ = ('name', '_config', '_raw', '_parsed', '_link_type', 'attached', 'changed')
 
+    def __init__(self, config: dict, data: dict = None, name: str = None, raw: Optional[str] = None):
         self.name = name
         self._config = config
-        self._data = {
-            'type': data.get('type', None),
-            'value': data.get('value', None),
-            'label': data.get('label', None),
-            'target': data.get('target', None),
-            'no_follow': data.get('no_follow', None),
-        }
+
+        # If we get the raw json string we only parse it on first access, see _data. As long as the data isn't
+        # changed, the raw string is also what gets stored again.
+        self._raw = raw
+        self.changed = raw is None
+        self._parsed = None
+        if raw is None:
+            data = data or {}
+            parsed = {key: data.get(key, None) for key in DATA_KEYS}
+            if data.get('snapshot'):
+                parsed['snapshot'] = data['snapshot']
+            self._parsed = LinkData(self, parsed)
+
+        # Memoized link type instance and real value (attached by prefetch_links or on first access). A real value
+        # of None means the target is missing. Both get reset as soon as the data changes.
+        self._link_type = None
+        self.attached = UNRESOLVED
+
+    @classmethod
+    def from_json(cls, config: dict, raw: Optional[str], name: str = None) -> 'Link':
+        """ Create a Link from the stored json string without parsing it yet. """
+        return cls(config=config, name=name, raw=raw or '')
+
+    @classmethod
+    def build(cls, type: str, target=None, label: str = None, new_tab: bool = False, no_follow: bool = False,
+              config: dict = None, name: str = None) -> 'Link':
+        """
+        Create a link from code, e.g. Link.build(type='page', target=page) or Link.build(type='input',
+        target='https://example.com'). Pass the config of the field (Model._meta.get_field('link').config) to get
+        the same behaviour as links loaded from it. Use linkit.types.validation.validate_links to check many links.
+        """
+        value = type_manager.get(type).build_value(target)
+        config = config or {'types': [type], 'allow_target': new_tab, 'allow_label': label is not None,
+                            'allow_no_follow': no_follow}
+        data = {'type': type, 'value': value, 'label': label, 'target': '_blank' if new_tab else None,
+                'no_follow': no_follow}
+
+        return cls(config=config, data=data, name=name)
+
+    @property
+    def _data(self) -> dict:
+        if self._parsed is None:
+            data = loads(self._raw) if self._raw else {}
+            for key in DATA_KEYS:
+                data.setdefault(key, None)
+            self._parsed = LinkData(self, data)
+
+        return self._parsed
+
+    def __getstate__(self) -> dict:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state: dict):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        if self._parsed is not None:
+            self._parsed = LinkData(self, self._parsed)
 
     def data(self, attribute: Optional[str] = None, default=None):
         if not attribute:
@@ -24,24 +185,127 @@ class Link(object):
 
         return self._data.get(attribute, default)
 
+    def set_data(self, attribute: str, value):
+        """ Change the stored data, the same as writing to data(). """
+        self._data[attribute] = value
+
+    def _data_changed(self, key: Optional[str] = None):
+        """
+        Called on every write to the data: the link gets stored again and, unless only the snapshot was written,
+        the snapshot and the memoized values are outdated.
+        """
+        self.changed = True
+        if key != 'snapshot':
+            dict.pop(self._parsed, 'snapshot', None)
+            self.invalidate()
+
+    def invalidate(self):
+        """ Forget the memoized link type and real value. """
+        self._link_type = None
+        self.attached = UNRESOLVED
+
     def config(self, attribute: Optional[str] = None, default=None):
         if not attribute:
             return self._config
 
         return self._config.get(attribute, default)
 
+    def attach(self, real_value):
+        """ Attach an already resolved real value so the link type doesn't need to query it. """
+        self.attached = real_value
+
     @property
     def link_type(self):
         """ Resolve the current type from the type_manager. Returns a LinkType. """
-        return type_manager.instance(self.data('type'), self)
+        if self._link_type is None or self._link_type.identifier != self.data('type'):
+            self._link_type = type_manager.instance(self.data('type'), self)
+
+        return self._link_type
 
     @property
     def value(self):
         return self.link_type.real_value()
 
+    @property
+    def snapshot(self) -> Optional[dict]:
+        """
+        The href and label stored in the json for the current language, if the field has snapshots enabled and the
+        snapshot isn't older than LINKIT_SNAPSHOT_MAX_AGE seconds.
+        """
+        if not self.config('snapshot'):
+            return None
+
+        snapshot = (self.data('snapshot') or {}).get(translation.get_language())
+        max_age = snapshot_max_age()
+        if snapshot and (max_age is None or time.time() - snapshot['time'] <= max_age):
+            return snapshot
+
+        return None
+
+    def take_snapshot(self, languages: list = None):
+        """
+        Resolve href and label for the given languages (default: the current one) and store them in the json. The
+        snapshots of other languages are kept, they're dropped anyway as soon as the link changes.
+        """
+        snapshot = dict(self.data('snapshot') or {})
+        for language in languages or [translation.get_language()]:
+            with translation.override(language):
+                label = self._lookup('label')
+                snapshot[language] = {
+                    'href': self._lookup('href'),
+                    'label': str(label) if label else label,
+                    'time': int(time.time()),
+                }
+
+        self._data['snapshot'] = snapshot
+
+    def _resolved(self, attribute: str):
+        """ Get href or label from the snapshot or the link type. """
+        with instrument(attribute, self.data('type')) as info:
+            snapshot = self.snapshot
+            if snapshot is not None:
+                info['cache'] = 'snapshot'
+                return snapshot[attribute]
+
+            return self._lookup(attribute, info)
+
+    def _lookup(self, attribute: str, info: dict = None):
+        """ Get href or label from the link type, using the resolution cache if it's enabled. """
+        link_type = self.link_type
+        if not resolution_cache.enabled or link_type.pk is None:
+            return self._from_type(link_type, attribute)[0]
+
+        resolved = resolution_cache.get(link_type.identifier, link_type.pk)
+        if info is not None:
+            info['cache'] = 'miss' if resolved is MISSING else 'hit'
+        if resolved is MISSING:
+            href, label = self._from_type(link_type, 'href', 'label')
+            resolved = {'href': href, 'label': str(label) if label else label}
+            resolution_cache.set(link_type.identifier, link_type.pk, resolved)
+
+        return resolved[attribute]
+
+    def _from_type(self, link_type, *attributes) -> list:
+        """
+        Read the attributes from the link type and record the target it had to load for them, no matter how the type
+        loads it. Targets already attached to the link or found in the identity map of the scope aren't lookups.
+        """
+        if link_type.pk is None:
+            return [getattr(link_type, attribute) for attribute in attributes]
+
+        with instrument('real_value', link_type.identifier, link_type.pk) as info:
+            if self.attached is not UNRESOLVED:
+                info['cache'] = 'hit'
+            elif (link_type.identifier, str(link_type.pk)) in (identity_map() or {}):
+                info['cache'] = 'identity'
+            else:
+                info['cache'] = 'miss'
+
+            return [getattr(link_type, attribute) for attribute in attributes]
+
     @property
     def href(self):
-        return self.link_type.href
+        return self._resolved('href')
 
     @property
     def target(self):
@@ -70,9 +334,77 @@ class Link(object):
         if self.config('allow_label') and self.data('label'):
             return self.data('label')
 
-        return type_manager.instance(self.data('type'), self).label
+        return self._resolved('label')
+
+    @property
+    def rel(self) -> str:
+        rel = []
+        if self.config('allow_no_follow') and self.data('no_follow'):
+            rel.append('nofollow')
+        if self.target == '_blank':
+            rel.append('noopener')
+
+        return ' '.join(rel)
+
+    def resolve(self) -> ResolvedLink:
+        """ Resolve href, label, target and rel with a single lookup of the target. """
+        if not self.set or self.data('type') not in type_manager:
+            return ResolvedLink(None, self.data('label') if self.config('allow_label') else None, '_self', '', False)
+
+        target = self.target
+        return ResolvedLink(self.href or None, self.label or None, target, self.rel, target != '_self')
+
+    @property
+    def async_safe(self) -> bool:
+        """ True if resolve() won't hit the database, so it can be called in an async context. """
+        if not self.set or self.data('type') not in type_manager:
+            return True
+
+        link_type = self.link_type
+        return link_type.async_safe and (link_type.model is None or self.attached is not UNRESOLVED)
+
+    async def aresolve(self) -> ResolvedLink:
+        """ Async counterpart of resolve(). Use linkit.querysets.aresolve_links for many links at once. """
+        from linkit.querysets import aresolve_links
+
+        resolved = await aresolve_links([self])
+        return resolved[0]
+
+    async def ahref(self) -> Optional[str]:
+        resolved = await self.aresolve()
+        return resolved.href
+
+    async def alabel(self) -> Optional[str]:
+        resolved = await self.aresolve()
+        return resolved.label
+
+    def as_html(self, **attrs) -> str:
+        """ Render the complete anchor tag, additional attributes (e.g. class) can be passed as kwargs. """
+        return self.resolve().as_html(**attrs)
+
+    def to_dict(self, resolve: bool = True) -> dict:
+        """
+        Dict for APIs. Resolved it contains type, href, label, target, rel and external, otherwise the stored data.
+        Use linkit.serializers.serialize_links to resolve many links with one query per type.
+        """
+        if not resolve:
+            return self.data().plain()
+
+        resolved = self.resolve()
+        return {
+            'type': self.data('type'),
+            'href': resolved.href,
+            'label': str(resolved.label) if resolved.label else None,
+            'target': resolved.target,
+            'rel': resolved.rel,
+            'external': resolved.external,
+        }
 
     def to_json(self) -> str:
+        """ The json to store, the unchanged raw string if the link was loaded from it and not changed since. """
+        if not self.changed and self._raw:
+            return self._raw
+
         return json.dumps(self.data(), cls=type_manager.serializer)
 
     def config_to_json(self) -> str:
@@ -0,0 +1,121 @@
+from django.db import NotSupportedError
+from django.db.models import CharField, Func, JSONField, Lookup, Transform, Value
+from django.db.models.fields.json import KeyTextTransform, KeyTransform
+from django.db.models.functions import Cast, Coalesce, NullIf
+
+from linkit.types.manager import type_manager
+
+
+class ValidJSON(Func):
+    """
+    The text if it's valid json, otherwise NULL, so a single malformed row doesn't make the cast fail. Checked with
+    json_valid on SQLite and IS JSON on PostgreSQL 16+. Other databases don't check it, there the query fails loudly
+    until the malformed values are cleaned up.
+    """
+    arity = 1
+
+    def _as_guarded_sql(self, compiler, template: str):
+        sql, params = compiler.compile(self.source_expressions[0])
+        return template.format(source=sql), list(params) * 2
+
+    def as_sql(self, compiler, connection, **extra_context):
+        return compiler.compile(self.source_expressions[0])
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self._as_guarded_sql(compiler, 'CASE WHEN json_valid({source}) THEN {source} END')
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        if connection.pg_version < 160000:
+            return self.as_sql(compiler, connection, **extra_context)
+
+        return self._as_guarded_sql(compiler, 'CASE WHEN ({source}) IS JSON THEN {source} END')
+
+
+def json_source(expression):
+    """
+    The stored link as json expression. Links stored in a CharField get casted, empty strings and (where the
+    database can check it) malformed json become NULL.
+    """
+    if getattr(expression.output_field, 'config', {}).get('native_json'):
+        return expression
+
+    return Cast(ValidJSON(NullIf(expression, Value(''))), JSONField())
+
+
+def target_expression(expression, value_keys: list):
+    """ The pk of the linked object as text, looked up under the given value keys. """
+    value = KeyTransform('value', json_source(expression))
+    if not value_keys:
+        return Value(None, output_field=CharField())
+
+    transforms = [KeyTextTransform(key, value) for key in value_keys]
+    target = Coalesce(*transforms) if len(transforms) > 1 else transforms[0]
+    return Cast(target, CharField())
+
+
+class LinkTypeTransform(Transform):
+    """ link__type='page' """
+    lookup_name = 'type'
+    output_field = CharField()
+
+    def as_sql(self, compiler, connection):
+        return compiler.compile(KeyTextTransform('type', json_source(self.lhs)))
+
+
+class LinkTargetTransform(Transform):
+    """
+    link__target_pk=42, mostly combined with link__type. The pk is looked up under the value keys of the types the
+    field allows, or only under the one of link_type if it's given, e.g. LinkTargetTransform('link', link_type='page')
+    for a functional index. Either way the expression doesn't depend on the types registered at the time.
+    """
+    lookup_name = 'target_pk'
+    output_field = CharField()
+
+    def __init__(self, expression, link_type: str = None, **extra):
+        super().__init__(expression, **extra)
+        self.link_type = link_type
+
+    def value_keys(self) -> list:
+        if self.link_type:
+            identifiers = [self.link_type]
+        else:
+            config = getattr(self.lhs.output_field, 'config', None)
+            if config is None:
+                field_class = type(self.lhs.output_field).__name__
+                raise ValueError('The target_pk of a {} needs a link_type.'.format(field_class))
+            identifiers = config['types']
+
+        return sorted({type_manager.get(identifier).value_key for identifier in identifiers} - {None})
+
+    def as_sql(self, compiler, connection):
+        return compiler.compile(target_expression(self.lhs, self.value_keys()))
+
+
+class LinkIsSetLookup(Lookup):
+    """ link__isset=True, the database equivalent of Link.set: the value contains at least one non-empty entry. """
+    lookup_name = 'isset'
+    prepare_rhs = False
+
+    def as_sql(self, compiler, connection):
+        raise NotSupportedError('The isset lookup is only supported on PostgreSQL and SQLite.')
+
+    def _as_vendor_sql(self, compiler, template: str):
+        sql, params = compiler.compile(json_source(self.lhs))
+        params = list(params) * template.count('{source}')
+        sql = template.format(source=sql)
+        if not self.rhs:
+            sql = 'NOT {}'.format(sql)
+
+        return sql, params
+
+    def as_postgresql(self, compiler, connection):
+        return self._as_vendor_sql(compiler, (
+            "EXISTS (SELECT 1 FROM jsonb_each_text(CASE WHEN jsonb_typeof(({source}) -> 'value') = 'object' "
+            "THEN ({source}) -> 'value' END) AS linkit_value WHERE linkit_value.value <> '')"
+        ))
+
+    def as_sqlite(self, compiler, connection):
+        return self._as_vendor_sql(compiler, (
+            "EXISTS (SELECT 1 FROM json_each(({source}), '$.value') AS linkit_value "
+            "WHERE linkit_value.value IS NOT NULL AND linkit_value.value <> '')"
+        ))
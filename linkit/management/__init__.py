@@ -0,0 +1,24 @@
+from typing import List, Optional, Tuple, Type
+
+from django.core.management import CommandError
+from django.db import models
+
+from linkit.model_fields import LinkField
+from linkit.utils import link_fields
+
+
+def selected_link_fields(label: Optional[str], **config) -> List[Tuple[Type[models.Model], LinkField]]:
+    """
+    The link_fields the --model option of the management commands selects: all of them without a label, otherwise
+    the ones of the given model (e.g. news.News). Raises a CommandError if the model has none.
+    """
+    fields = link_fields(**config)
+    if not label:
+        return fields
+
+    fields = [(model, field) for model, field in fields if model._meta.label_lower == label.lower()]
+    if not fields:
+        options = ''.join(' with {}={}'.format(key, value) for key, value in config.items())
+        raise CommandError('No LinkField{} found on {}'.format(options, label))
+
+    return fields
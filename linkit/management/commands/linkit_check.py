@@ -0,0 +1,56 @@
+import csv
+import io
+import json
+
+from django.core.management import BaseCommand
+
+from linkit.management import selected_link_fields
+from linkit.scanner import DanglingLink, scan
+
+
+class Command(BaseCommand):
+    help = 'Find links pointing to pages, files or models which no longer exist.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--model', help='Only check the given model, e.g. news.News')
+        parser.add_argument('--chunk-size', type=int, default=2000)
+        parser.add_argument('--workers', type=int, default=None, help='Processes to use, defaults to the CPU count')
+        parser.add_argument('--format', choices=['text', 'json', 'csv'], default='text')
+        parser.add_argument('--output', help='Write the report to this file instead of stdout')
+
+    def handle(self, *args, **options):
+        fields = selected_link_fields(options['model'])
+
+        dangling = list(scan(fields, options['chunk_size'], options['workers'], self.progress))
+        self.stderr.write('')
+
+        report = self.render_report(dangling, options['format'])
+        if options['output']:
+            with open(options['output'], 'w', newline='') as output:
+                output.write(report)
+        else:
+            self.stdout.write(report, ending='')
+
+    def progress(self, progress):
+        self.stderr.write('{}/{} chunks, {} rows, {} dangling, {:.0f} rows/s'.format(
+            progress.chunks_done, progress.chunks_total, progress.rows, progress.dangling, progress.rows_per_second),
+            ending='\r')
+
+    @staticmethod
+    def render_report(dangling: list, format: str) -> str:
+        output = io.StringIO()
+        if format == 'json':
+            json.dump([link._asdict() for link in dangling], output, indent=2)
+            output.write('\n')
+        elif format == 'csv':
+            writer = csv.writer(output)
+            writer.writerow(DanglingLink._fields)
+            writer.writerows(dangling)
+        else:
+            for link in dangling:
+                if link.reason == 'unregistered':
+                    output.write('{} {} {}: link type {} is not registered\n'.format(*link))
+                else:
+                    output.write('{} {} {}: {} {} does not exist\n'.format(*link))
+
+        return output.getvalue()
@@ -0,0 +1,42 @@
+import json
+from datetime import timedelta
+
+from django.core.management import BaseCommand
+
+from linkit.external import ExternalLinkChecker, check_external_links
+from linkit.management import selected_link_fields
+
+
+class Command(BaseCommand):
+    help = 'Check the urls of all external (input) links and store the results in ExternalLinkCheck.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--model', help='Only check the given model, e.g. news.News')
+        parser.add_argument('--concurrency', type=int, default=50, help='Requests running at once')
+        parser.add_argument('--per-host', type=int, default=4, help='Connections per host')
+        parser.add_argument('--rate', type=float, default=5, help='Requests per second and host, 0 for no limit')
+        parser.add_argument('--timeout', type=float, default=10, help='Seconds per request')
+        parser.add_argument('--all', action='store_true', help='Ignore the recheck interval')
+        parser.add_argument('--format', choices=['text', 'json'], default='text')
+
+    def handle(self, *args, **options):
+        fields = selected_link_fields(options['model'])
+
+        checker = ExternalLinkChecker(concurrency=options['concurrency'], per_host=options['per_host'],
+                                      rate=options['rate'] or None, timeout=options['timeout'])
+        report = check_external_links(fields, checker, interval=timedelta(0) if options['all'] else None)
+
+        if options['format'] == 'json':
+            summary = report.summary()
+            summary['broken'] = [result._asdict() for result in report.broken]
+            self.stdout.write(json.dumps(summary, indent=2))
+            return
+
+        for result in report.broken:
+            self.stdout.write('{} {}'.format(result.url, result.status or result.error))
+
+        self.stdout.write('{} urls, {} broken, {:.1f}s, {:.1f} urls/s'.format(
+            len(report.results), len(report.broken), report.seconds, report.urls_per_second))
+        for host, latency in report.host_latency().items():
+            self.stdout.write('  {}: {} requests, avg {:.3f}s, p95 {:.3f}s, max {:.3f}s'.format(
+                host, latency['requests'], latency['avg'], latency['p95'], latency['max']))
@@ -0,0 +1,19 @@
+from django.core.management import BaseCommand
+
+from linkit.management import selected_link_fields
+from linkit.references import rebuild_references
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the LinkReference table ("what links here") for all LinkFields.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--model', help='Only rebuild the given model, e.g. news.News')
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        fields = selected_link_fields(options['model'])
+
+        for model, field in fields:
+            count = rebuild_references(model, field, options['chunk_size'])
+            self.stdout.write('{}.{}: {} references'.format(model._meta.label, field.name, count))
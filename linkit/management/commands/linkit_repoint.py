@@ -0,0 +1,34 @@
+from django.core.exceptions import ValidationError
+from django.core.management import BaseCommand, CommandError
+
+from linkit.management import selected_link_fields
+from linkit.repoint import repoint
+
+
+class Command(BaseCommand):
+    help = 'Point all links from one target to another, e.g. after merging pages or replacing a file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--type', required=True, help='Link type, e.g. page or file')
+        parser.add_argument('--from', required=True, dest='old_pk', help='Pk of the old target')
+        parser.add_argument('--to', required=True, dest='new_pk', help='Pk of the new target')
+        parser.add_argument('--model', help='Only rewrite the given model, e.g. news.News')
+        parser.add_argument('--dry-run', action='store_true', help='Only count the affected rows')
+        parser.add_argument('--chunk-size', type=int, default=2000)
+        parser.add_argument('--scan', action='store_true',
+                            help='Search the link columns instead of trusting the references table')
+
+    def handle(self, *args, **options):
+        fields = selected_link_fields(options['model'])
+
+        try:
+            counts = repoint(options['type'], options['old_pk'], options['new_pk'], fields=fields,
+                             dry_run=options['dry_run'], chunk_size=options['chunk_size'], scan=options['scan'])
+        except ValidationError as e:
+            raise CommandError(' '.join(e.messages))
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        verb = 'would be repointed' if options['dry_run'] else 'repointed'
+        for name, count in counts.items():
+            self.stdout.write('{}: {} links {}'.format(name, count, verb))
@@ -0,0 +1,41 @@
+import time
+
+from django.core.management import BaseCommand
+
+from linkit.link import snapshot_max_age
+from linkit.management import selected_link_fields
+from linkit.utils import refresh_snapshots, snapshot_languages
+
+
+class Command(BaseCommand):
+    help = 'Refresh the href/label snapshots of all LinkFields with snapshot=True.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--model', help='Only refresh the given model, e.g. news.News')
+        parser.add_argument('--stale', action='store_true', help='Only refresh snapshots older than the max age')
+        parser.add_argument('--chunk-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        fields = selected_link_fields(options['model'], snapshot=True)
+
+        languages = snapshot_languages()
+        for model, field in fields:
+            instances = model._default_manager.only(model._meta.pk.attname, field.attname)
+            instances = instances.iterator(chunk_size=options['chunk_size'])
+            if options['stale']:
+                instances = (instance for instance in instances if self.is_stale(getattr(instance, field.attname),
+                                                                                 languages))
+
+            count = refresh_snapshots(instances, field, languages, options['chunk_size'])
+            self.stdout.write('{}.{}: {} snapshots refreshed'.format(model._meta.label, field.name, count))
+
+    @staticmethod
+    def is_stale(link, languages: list) -> bool:
+        max_age = snapshot_max_age()
+        snapshot = link.data('snapshot') or {}
+        for language in languages:
+            entry = snapshot.get(language)
+            if not entry or (max_age is not None and time.time() - entry['time'] > max_age):
+                return True
+
+        return False
@@ -0,0 +1,32 @@
+from django.conf import settings
+
+from linkit.instrumentation import track_links
+from linkit.scope import request_scope
+
+
+def tracking_enabled() -> bool:
+    """ Resolutions are only recorded per request if there's a budget to check or in DEBUG mode. """
+    return settings.DEBUG or getattr(settings, 'LINKIT_RESOLUTION_BUDGET', None) is not None
+
+
+class LinkitMiddleware(object):
+    """
+    Opens a request scope, so linkit can share cached values during the whole request. With DEBUG or a
+    LINKIT_RESOLUTION_BUDGET it also records all link resolutions on request.linkit_stats and logs a warning if
+    there are more than the budget.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not tracking_enabled():
+            with request_scope():
+                return self.get_response(request)
+
+        with request_scope(), track_links() as stats:
+            response = self.get_response(request)
+
+        request.linkit_stats = stats
+        stats.check_budget(request.path)
+        return response
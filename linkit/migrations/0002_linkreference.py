@@ -0,0 +1,30 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('linkit', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LinkReference',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_pk', models.CharField(max_length=255)),
+                ('field_name', models.CharField(max_length=255)),
+                ('link_type', models.CharField(max_length=255)),
+                ('target_pk', models.CharField(max_length=255)),
+                ('source_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'indexes': [
+                    models.Index(fields=['link_type', 'target_pk'], name='linkit_reference_target_idx'),
+                    models.Index(fields=['source_type', 'source_pk'], name='linkit_reference_source_idx'),
+                ],
+            },
+        ),
+    ]
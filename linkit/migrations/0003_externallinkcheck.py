@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('linkit', '0002_linkreference'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExternalLinkCheck',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64, unique=True)),
+                ('url', models.TextField()),
+                ('status', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('error', models.CharField(blank=True, max_length=255)),
+                ('ok', models.BooleanField(default=False)),
+                ('seconds', models.FloatField(blank=True, null=True)),
+                ('checked_at', models.DateTimeField(db_index=True)),
+            ],
+        ),
+    ]
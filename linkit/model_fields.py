@@ -1,9 +1,10 @@
-import json
 from typing import Optional, Union
 
 from django.db import models
+from django.db.models.signals import post_delete, post_save
 
 from linkit.link import Link
+from linkit.lookups import LinkIsSetLookup, LinkTargetTransform, LinkTypeTransform
 
 
 class LinkField(models.Field):
@@ -14,42 +15,87 @@ class LinkField(models.Field):
     label: str      Link label if allow_label from the config is True
     target: str     None or _blank
     no_follow: bool True or False
+    snapshot: dict  Resolved href and label per language, only if snapshot is True
+
+    With native_json=True the link is stored in a json column (jsonb on PostgreSQL) instead. Either way you can
+    query it with link__type='page', link__target_pk=42 and link__isset=True.
     """
 
     def __init__(self, types: list = None, allow_target: bool = False, allow_label: bool = True,
-                 allow_no_follow: bool = False, *args, **kwargs):
+                 allow_no_follow: bool = False, snapshot: bool = False, native_json: bool = False, *args, **kwargs):
         kwargs['max_length'] = 2000
         self.config = {
             'types': types or ['page'],
             'allow_target': allow_target,
             'allow_label': allow_label,
             'allow_no_follow': allow_no_follow,
+            'snapshot': snapshot,
+            'native_json': native_json,
         }
 
         super().__init__(*args, **kwargs)
 
+    def contribute_to_class(self, cls, name, *args, **kwargs):
+        super().contribute_to_class(cls, name, *args, **kwargs)
+
+        # Keep the LinkReference table up to date, but not for abstract or historical models used in migrations. The
+        # receivers aren't bound to the model, so proxies and child models of multi-table inheritance are covered too.
+        if not cls._meta.abstract and cls.__module__ != '__fake__':
+            uid = 'linkit_references_{}_{}'.format(cls._meta.label_lower, name)
+            post_save.connect(self._save_references, weak=False, dispatch_uid=uid)
+            post_delete.connect(self._delete_references, weak=False, dispatch_uid=uid)
+
+    def _save_references(self, sender, instance, raw: bool = False, **kwargs):
+        from linkit import references
+        if issubclass(sender, self.model) and references.enabled() and not raw:
+            references.update_references(instance, self)
+
+    def _delete_references(self, sender, instance, **kwargs):
+        from linkit import references
+        if issubclass(sender, self.model) and references.enabled():
+            references.delete_references(instance, self)
+
     def formfield(self, **kwargs):
         from linkit.form_fields import LinkFormField
         defaults = {'form_class': LinkFormField, 'config': self.config, 'name': self.name}
         defaults.update(kwargs)
         return super().formfield(**defaults)
 
-    def _parse_link(self, value: Optional[str]) -> Link:
-        """ Map given json string to Link object. """
-        data = {}
+    def _parse_link(self, value: Optional[Union[str, dict]]) -> Link:
+        """ Map given json string to Link object. The json only gets parsed as soon as the link is accessed. """
+        if isinstance(value, dict):
+            # Some database drivers already decode json columns
+            link = Link(config=self.config, data=value, name=self.name)
+            link.changed = False
+            return link
+
+        return Link.from_json(config=self.config, raw=value, name=self.name)
 
-        if value:
-            data = json.loads(value)
+    def pre_save(self, model_instance, add):
+        """ Store the resolved href and label in the json if snapshots are enabled. """
+        link = super().pre_save(model_instance, add)
+        if link and self.config['snapshot'] and link.set:
+            link.take_snapshot()
 
-        return Link(config=self.config, data=data, name=self.name)
+        return link
 
     def get_prep_value(self, link: Optional[Link]) -> Optional[str]:
-        """ Opposite of to_python to ensure our Link object can be stored in the DB. """
+        """
+        Opposite of to_python to ensure our Link object can be stored in the DB. Unchanged links return the string
+        they were loaded from without serializing them again.
+        """
         if link:
             return link.to_json()
 
         return None
 
+    def get_placeholder(self, value, compiler, connection) -> str:
+        """ We pass the json as string, PostgreSQL needs an explicit cast for jsonb columns. """
+        if self.config['native_json'] and connection.vendor == 'postgresql':
+            return '%s::jsonb'
+
+        return '%s'
+
     def from_db_value(self, value: Optional[str], expression, connection, context = None) -> Optional[Link]:
         """ Convert data stored in db to Link object. """
         return self._parse_link(value)
@@ -61,8 +107,12 @@ class LinkField(models.Field):
 
         return self._parse_link(value)
 
+    def value_to_string(self, obj) -> Optional[str]:
+        """ Used by Django's serializers (e.g. dumpdata), returns the stored json. """
+        return self.get_prep_value(self.value_from_object(obj))
+
     def get_internal_type(self):
-        return 'CharField'
+        return 'JSONField' if self.config['native_json'] else 'CharField'
 
     def deconstruct(self):
         name, path, args, kwargs = super().deconstruct()
@@ -76,6 +126,17 @@ class LinkField(models.Field):
         kwargs['allow_label'] = self.config['allow_label']
         kwargs['allow_no_follow'] = self.config['allow_no_follow']
 
+        # Only include newer options if they're set, so existing migrations stay valid
+        if self.config['snapshot']:
+            kwargs['snapshot'] = True
+        if self.config['native_json']:
+            kwargs['native_json'] = True
+
         kwargs['name'] = self.name
 
         return name, path, args, kwargs
+
+
+LinkField.register_lookup(LinkTypeTransform)
+LinkField.register_lookup(LinkTargetTransform)
+LinkField.register_lookup(LinkIsSetLookup)
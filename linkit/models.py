@@ -1,4 +1,7 @@
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.db.models import Q
 from filer.fields.file import FilerFileField
 
 
@@ -9,3 +12,55 @@ class FakeLink(models.Model):
     with this model.
     """
     fake_file = FilerFileField(blank=True, null=True, on_delete=models.CASCADE)
+
+
+class LinkReferenceQuerySet(models.QuerySet):
+    def to(self, obj: models.Model) -> 'LinkReferenceQuerySet':
+        """ All references pointing to the given object, e.g. a Page or a filer File. """
+        from linkit.types.manager import type_manager
+
+        query = Q(pk__in=[])
+        for link_type in type_manager.all():
+            if link_type.model is not None and isinstance(obj, link_type.model):
+                query |= Q(link_type=link_type.identifier, target_pk=str(obj.pk))
+
+        return self.filter(query)
+
+
+class LinkReference(models.Model):
+    """
+    Reverse index of all LinkFields: which object links to which target. It's maintained on save if the setting
+    LINKIT_REFERENCES is True and can be rebuilt with the linkit_references management command.
+    """
+    source_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    source_pk = models.CharField(max_length=255)
+    source = GenericForeignKey('source_type', 'source_pk')
+    field_name = models.CharField(max_length=255)
+    link_type = models.CharField(max_length=255)
+    target_pk = models.CharField(max_length=255)
+
+    objects = LinkReferenceQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['link_type', 'target_pk'], name='linkit_reference_target_idx'),
+            models.Index(fields=['source_type', 'source_pk'], name='linkit_reference_source_idx'),
+        ]
+
+    def __str__(self):
+        return '{}.{} ({}) -> {} {}'.format(self.source_type, self.field_name, self.source_pk, self.link_type,
+                                            self.target_pk)
+
+
+class ExternalLinkCheck(models.Model):
+    """ Result of the last check of an external url (input link), see the linkit_check_external command. """
+    key = models.CharField(max_length=64, unique=True)
+    url = models.TextField()
+    status = models.PositiveSmallIntegerField(null=True, blank=True)
+    error = models.CharField(max_length=255, blank=True)
+    ok = models.BooleanField(default=False)
+    seconds = models.FloatField(null=True, blank=True)
+    checked_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return '{} ({})'.format(self.url, self.status or self.error)
@@ -0,0 +1,36 @@
+from django.db import migrations
+
+
+class PrepareNativeJSON(migrations.RunPython):
+    """
+    Migration operation to run before the AlterField which switches an existing LinkField to native_json=True. The
+    database converts the column in place, but it can't cast empty strings to json, so we replace them with NULL:
+
+    operations = [
+        PrepareNativeJSON('teaser', 'link'),
+        migrations.AlterField('teaser', 'link', LinkField(..., native_json=True)),
+    ]
+    """
+
+    def __init__(self, model_name: str, field_name: str, **kwargs):
+        self.model_name = model_name
+        self.field_name = field_name
+        super().__init__(self.forwards, migrations.RunPython.noop, **kwargs)
+
+    def forwards(self, apps, schema_editor):
+        model = apps.get_model(self.app_label, self.model_name)
+        column = model._meta.get_field(self.field_name).column
+        schema_editor.execute('UPDATE {table} SET {column} = NULL WHERE {column} = %s'.format(
+            table=schema_editor.quote_name(model._meta.db_table),
+            column=schema_editor.quote_name(column),
+        ), [''])
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        self.app_label = app_label
+        super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def deconstruct(self):
+        return self.__class__.__name__, [self.model_name, self.field_name], {}
+
+    def describe(self):
+        return 'Replace empty {}.{} values with NULL'.format(self.model_name, self.field_name)
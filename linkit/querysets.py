@@ -0,0 +1,120 @@
+import asyncio
+from collections import defaultdict
+from typing import Iterable, List
+
+from asgiref.sync import sync_to_async
+from django.db import models
+
+from linkit.link import Link, ResolvedLink
+from linkit.scope import attach_loaded_target, remember_target
+from linkit.types.contracts import UNRESOLVED
+
+
+def _group_links(links: Iterable[Link]) -> dict:
+    """
+    Group the unresolved links pointing to a database row by their link type class: {type: [(link, pk)]}. Links
+    whose target was already loaded in the current scope get it attached right away.
+    """
+    grouped = defaultdict(list)
+    for link in links:
+        if not link or not link.data('type') or link.attached is not UNRESOLVED:
+            continue
+
+        link_type = link.link_type
+        if link_type.pk is None:
+            continue
+
+        if not attach_loaded_target(link, link_type.identifier, link_type.pk):
+            grouped[type(link_type)].append((link, str(link_type.pk)))
+
+    return grouped
+
+
+def _attach(type_class, entries: list, values):
+    if values is None:
+        return
+
+    for link, pk in entries:
+        link.attach(values.get(pk))
+        remember_target(link, type_class.identifier, pk)
+
+
+def resolve_links(links: Iterable[Link]):
+    """
+    Group the given links by their link type and resolve the targets of every type with one single query. The
+    resolved values get attached to the links, so href, label and value won't hit the database anymore.
+    """
+    for type_class, entries in _group_links(links).items():
+        _attach(type_class, entries, type_class.resolve_many(list({pk for link, pk in entries})))
+
+
+async def aresolve_links(links: Iterable[Link]) -> List[ResolvedLink]:
+    """
+    Async counterpart of resolve_links, which also returns the resolved links. The targets of all types are loaded
+    concurrently. Links whose href and label still need the database afterwards are resolved in one single thread
+    hop together.
+    """
+    links = list(links)
+    grouped = _group_links(links)
+    values = await asyncio.gather(*[
+        type_class.aresolve_many(list({pk for link, pk in entries})) for type_class, entries in grouped.items()
+    ])
+    for (type_class, entries), resolved in zip(grouped.items(), values):
+        _attach(type_class, entries, resolved)
+
+    results = {}
+    blocking = []
+    for index, link in enumerate(links):
+        if link.async_safe:
+            results[index] = link.resolve()
+        else:
+            blocking.append(index)
+
+    if blocking:
+        resolved = await sync_to_async(lambda: [links[index].resolve() for index in blocking])()
+        results.update(zip(blocking, resolved))
+
+    return [results[index] for index in range(len(links))]
+
+
+def prefetch_links(instances: Iterable[models.Model], *field_names: str) -> list:
+    """ Resolve the given LinkFields of all instances with one query per link type. """
+    instances = list(instances)
+    links = []
+    for instance in instances:
+        for field_name in field_names:
+            links.append(getattr(instance, field_name, None))
+
+    resolve_links(links)
+    return instances
+
+
+class LinkQuerySet(models.QuerySet):
+    """
+    QuerySet which can resolve the targets of its LinkFields in bulk as soon as the results are fetched:
+    Teaser.objects.prefetch_links('link')
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._prefetch_link_fields = ()
+        self._prefetch_links_done = False
+
+    def prefetch_links(self, *field_names: str) -> 'LinkQuerySet':
+        clone = self._chain() if hasattr(self, '_chain') else self._clone()
+        clone._prefetch_link_fields = clone._prefetch_link_fields + field_names
+        return clone
+
+    def _clone(self, *args, **kwargs):
+        clone = super()._clone(*args, **kwargs)
+        clone._prefetch_link_fields = self._prefetch_link_fields
+        return clone
+
+    def _fetch_all(self):
+        super()._fetch_all()
+        if self._prefetch_link_fields and not self._prefetch_links_done:
+            prefetch_links(self._result_cache, *self._prefetch_link_fields)
+            self._prefetch_links_done = True
+
+
+LinkManager = models.Manager.from_queryset(LinkQuerySet)
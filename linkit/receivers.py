@@ -0,0 +1,109 @@
+from functools import lru_cache, partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from linkit.cache import resolution_cache
+from linkit.scope import identity_map
+from linkit.types.manager import type_manager
+from linkit.utils import link_fields, referencing_rows, refresh_snapshots, snapshot_languages
+
+
+@lru_cache(maxsize=None)
+def snapshot_fields() -> list:
+    return link_fields(snapshot=True)
+
+
+@lru_cache(maxsize=None)
+def field_types(snapshot_only: bool) -> tuple:
+    """ The identifiers of the types allowed by all (or all snapshot) LinkFields. """
+    fields = snapshot_fields() if snapshot_only else link_fields()
+    return tuple(sorted({identifier for model, field in fields for identifier in field.config['types']}))
+
+
+def watched_types() -> list:
+    """
+    The link types to check when something gets saved or deleted. Types registered by path and not yet imported
+    can't have resolved anything in this process, so they're skipped, unless resolved values outlive the process:
+    the types of snapshot fields and, with a shared cache, of all fields are imported.
+    """
+    types = {link_type.identifier: link_type for link_type in type_manager.loaded()}
+    for identifier in field_types(snapshot_only=not (resolution_cache.enabled and resolution_cache.shared)):
+        if identifier not in types and identifier in type_manager:
+            types[identifier] = type_manager.get(identifier)
+
+    return list(types.values())
+
+
+def refresh_link_targets(identifier: str, pks: list, fields: list):
+    """ Remove the cached hrefs and labels of the given targets and refresh the snapshots of the links to them. """
+    if resolution_cache.enabled:
+        resolution_cache.invalidate(identifier, pks)
+
+    link_type = type_manager.get(identifier)
+    for model, field in fields:
+        if identifier in field.config['types']:
+            rows = referencing_rows(model, field, link_type, pks)
+            refresh_snapshots(rows, field, snapshot_languages())
+
+
+@receiver([post_save, post_delete])
+def update_link_targets(sender, instance, signal=None, using=None, **kwargs):
+    """
+    Remove cached hrefs and labels and refresh the snapshots of all links pointing to a target affected by the saved
+    or deleted instance. Only the models watched by a link type are considered and the work is deferred until the
+    transaction is committed, so a rollback doesn't leave refreshed snapshots behind.
+    """
+    fields = snapshot_fields()
+    if not resolution_cache.enabled and not fields:
+        return
+
+    for link_type in watched_types():
+        if not link_type.watches(sender):
+            continue
+
+        pks = link_type.affected_pks(instance, deleted=signal is post_delete)
+        if pks:
+            transaction.on_commit(partial(refresh_link_targets, link_type.identifier, pks, fields), using=using)
+
+
+@receiver([post_save, post_delete])
+def forget_loaded_targets(sender, instance, signal=None, **kwargs):
+    """ Drop the targets affected by the saved or deleted instance from the identity map of the current scope. """
+    targets = identity_map()
+    if not targets:
+        return
+
+    identifiers = {identifier for identifier, pk in targets}
+    for link_type in type_manager.loaded():
+        if link_type.identifier in identifiers and link_type.watches(sender):
+            for pk in link_type.affected_pks(instance, deleted=signal is post_delete):
+                targets.pop((link_type.identifier, str(pk)), None)
+
+
+@receiver([post_save, post_delete])
+def invalidate_file_url(sender, instance, **kwargs):
+    if sender._meta.app_label != 'filer' or not getattr(settings, 'LINKIT_FILE_URL_CACHE', None):
+        return
+
+    # Filer is loaded anyway if it sends signals, but linkit shouldn't import it before
+    from filer.models import File
+
+    from linkit.types.file import file_url_cache, storage_key
+
+    if isinstance(instance, File):
+        file_url_cache.invalidate(storage_key(), [instance.pk])
+
+
+try:
+    from cms.signals import post_publish, post_unpublish
+except ImportError:
+    # Publishing signals got removed in django-cms 4, saving the versioned content triggers post_save anyway
+    pass
+else:
+    @receiver([post_publish, post_unpublish])
+    def update_published_page(sender, instance, **kwargs):
+        update_link_targets(sender, instance, signal=post_save)
+        forget_loaded_targets(sender, instance, signal=post_save)
@@ -0,0 +1,72 @@
+from typing import Type
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, router, transaction
+
+from linkit.models import LinkReference
+from linkit.utils import chunked, link_target
+
+
+def enabled() -> bool:
+    return getattr(settings, 'LINKIT_REFERENCES', False)
+
+
+def update_references(instance: models.Model, field):
+    """
+    Store the target of the given LinkField of the instance, takes at most two queries. References belong to the
+    model declaring the field, no matter if the instance is a proxy or a child of it.
+    """
+    references = LinkReference.objects.filter(
+        source_type=ContentType.objects.get_for_model(field.model),
+        source_pk=str(instance.pk),
+        field_name=field.name,
+    )
+
+    target = link_target(getattr(instance, field.attname))
+    if target is None:
+        references.delete()
+        return
+
+    if not references.update(link_type=target[0], target_pk=target[1]):
+        LinkReference.objects.create(
+            source_type=ContentType.objects.get_for_model(field.model),
+            source_pk=str(instance.pk),
+            field_name=field.name,
+            link_type=target[0],
+            target_pk=target[1],
+        )
+
+
+def delete_references(instance: models.Model, field):
+    LinkReference.objects.filter(
+        source_type=ContentType.objects.get_for_model(field.model),
+        source_pk=str(instance.pk),
+        field_name=field.name,
+    ).delete()
+
+
+def rebuild_references(model: Type[models.Model], field, chunk_size: int = 2000) -> int:
+    """
+    Replace all references of the given model field, reading and writing in chunks. Runs in a transaction, so the
+    old references stay if it fails. Returns the count.
+    """
+    source_type = ContentType.objects.get_for_model(model)
+    count = 0
+    with transaction.atomic(using=router.db_for_write(LinkReference)):
+        LinkReference.objects.filter(source_type=source_type, field_name=field.name).delete()
+
+        rows = model._default_manager.values_list('pk', field.attname).iterator(chunk_size=chunk_size)
+        for chunk in chunked(rows, chunk_size):
+            references = []
+            for pk, link in chunk:
+                target = link_target(link)
+                if target is not None:
+                    references.append(LinkReference(source_type=source_type, source_pk=str(pk),
+                                                    field_name=field.name, link_type=target[0], target_pk=target[1]))
+
+            LinkReference.objects.bulk_create(references)
+            count += len(references)
+
+    return count
+
@@ -0,0 +1,153 @@
+import json
+from typing import Iterator, List, Optional, Tuple, Type
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections, models, router, transaction
+
+from linkit import references
+from linkit.model_fields import LinkField
+from linkit.models import LinkReference
+from linkit.types.contracts import LinkType
+from linkit.types.manager import type_manager
+from linkit.utils import chunked, link_fields, referencing_query
+
+
+def _update_sql(vendor: str, field: LinkField) -> Optional[str]:
+    """
+    Expression setting the target in the database, drops the outdated snapshot. Values which aren't a dict (plain
+    pks of the ModelLinkType) are replaced as a whole. On PostgreSQL a CharField is casted to jsonb and back to text.
+    None if not supported.
+    """
+    if vendor == 'postgresql':
+        source = '{column}' if field.config['native_json'] else '({column})::jsonb'
+        sql = ("CASE WHEN jsonb_typeof(SOURCE -> 'value') = 'object' "
+               "THEN jsonb_set(SOURCE - 'snapshot', %s::text[], %s::jsonb) "
+               "ELSE jsonb_set(SOURCE - 'snapshot', '{{value}}', %s::jsonb) END").replace('SOURCE', source)
+        return sql if field.config['native_json'] else '(' + sql + ')::text'
+    if vendor == 'sqlite':
+        return ("CASE WHEN json_type({column}, '$.value') = 'object' "
+                "THEN json_set(json_remove({column}, '$.snapshot'), %s, json(%s)) "
+                "ELSE json_set(json_remove({column}, '$.snapshot'), '$.value', json(%s)) END")
+
+    return None
+
+
+def _path_param(vendor: str, link_type: Type[LinkType]) -> str:
+    if vendor == 'postgresql':
+        return '{{value,{}}}'.format(link_type.value_key)
+
+    return '$.value.{}'.format(link_type.value_key)
+
+
+def _references(model: Type[models.Model], field: LinkField, link_type: Type[LinkType], pk):
+    return LinkReference.objects.filter(
+        source_type=ContentType.objects.get_for_model(model),
+        field_name=field.name,
+        link_type=link_type.identifier,
+        target_pk=str(pk),
+    )
+
+
+def affected_pks(model: Type[models.Model], field: LinkField, link_type: Type[LinkType], pk,
+                 chunk_size: int = 2000, scan: bool = False) -> Iterator:
+    """
+    Pks of the rows whose link points to the given target. Uses the LinkReference index if references are enabled,
+    otherwise or with scan the json of the whole table is scanned. The index misses rows written without signals
+    (queryset.update, bulk_create, raw sql) until linkit_references rebuilds it, scan doesn't rely on it.
+    """
+    if references.enabled() and not scan:
+        source_pks = _references(model, field, link_type, pk).values_list('pk', 'source_pk')
+        for reference_pk, source_pk in _paged(source_pks, chunk_size):
+            yield model._meta.pk.to_python(source_pk)
+        return
+
+    queryset = model._default_manager.filter(referencing_query(field.attname, link_type, [pk]))
+    for row in _paged(queryset.values_list('pk'), chunk_size):
+        yield row[0]
+
+
+def _paged(rows: models.QuerySet, chunk_size: int) -> Iterator[tuple]:
+    """
+    The rows of a values_list starting with the pk, ordered by it and fetched with a query per chunk instead of an
+    open cursor, so the table can be written while the rows are streamed.
+    """
+    last = None
+    while True:
+        chunk = list((rows if last is None else rows.filter(pk__gt=last)).order_by('pk')[:chunk_size])
+        yield from chunk
+        if len(chunk) < chunk_size:
+            return
+        last = chunk[-1][0]
+
+
+def _repoint_in_database(model: Type[models.Model], field: LinkField, link_type: Type[LinkType], pks: list,
+                         new_pk, using: str, sql: str) -> int:
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        cursor.execute('UPDATE {table} SET {column} = {value} WHERE {pk} IN ({placeholders})'.format(
+            table=connection.ops.quote_name(model._meta.db_table),
+            column=connection.ops.quote_name(field.column),
+            value=sql.format(column=connection.ops.quote_name(field.column)),
+            pk=connection.ops.quote_name(model._meta.pk.column),
+            placeholders=', '.join(['%s'] * len(pks)),
+        ), [_path_param(connection.vendor, link_type), json.dumps(new_pk, default=str),
+            json.dumps(new_pk, default=str)] + pks)
+        return cursor.rowcount
+
+
+def _repoint_in_python(model: Type[models.Model], field: LinkField, link_type: Type[LinkType], pks: list,
+                       new_pk, using: str) -> int:
+    instances = list(model._default_manager.using(using).filter(pk__in=pks).only(model._meta.pk.attname,
+                                                                                   field.attname))
+    for instance in instances:
+        link = getattr(instance, field.attname)
+        value = link.data('value')
+        link.set_data('value', {**value, link_type.value_key: new_pk} if isinstance(value, dict) else new_pk)
+
+    model._default_manager.using(using).bulk_update(instances, [field.attname])
+    return len(instances)
+
+
+def repoint(identifier: str, old_pk, new_pk, fields: List[Tuple[Type[models.Model], LinkField]] = None,
+            dry_run: bool = False, chunk_size: int = 2000, scan: bool = False) -> dict:
+    """
+    Point all links of the given type from one target to another, e.g. after merging two pages or replacing a file.
+    Rows are rewritten chunk by chunk, each in its own transaction, directly in the database on PostgreSQL
+    and SQLite and with bulk_update otherwise. The rows are found with the LinkReference index if enabled, with scan
+    the column itself is searched. Returns the number of rows per 'app.Model.field'; with dry_run they are only
+    counted. Snapshots of rewritten links are dropped, refresh them with linkit_snapshots.
+    """
+    link_type = type_manager.get(identifier)
+    if link_type.model is None or not link_type.value_key:
+        raise ValueError('Links of type "{}" don\'t point to a database row.'.format(identifier))
+
+    new_pk = link_type.model._meta.pk.to_python(new_pk)
+    if not dry_run and not link_type.model._default_manager.filter(pk=new_pk).exists():
+        raise ValueError('{} {} does not exist.'.format(link_type.model._meta.verbose_name, new_pk))
+
+    counts = {}
+    for model, field in fields or link_fields():
+        if identifier not in field.config['types']:
+            continue
+
+        using = router.db_for_write(model)
+        sql = _update_sql(connections[using].vendor, field)
+        count = 0
+        for pks in chunked(affected_pks(model, field, link_type, old_pk, chunk_size, scan), chunk_size):
+            if dry_run:
+                count += len(pks)
+                continue
+
+            with transaction.atomic(using=using):
+                if sql:
+                    count += _repoint_in_database(model, field, link_type, pks, new_pk, using, sql)
+                else:
+                    count += _repoint_in_python(model, field, link_type, pks, new_pk, using)
+
+        if not dry_run:
+            # The rows were written without signals, so we update the references ourselves
+            _references(model, field, link_type, old_pk).update(target_pk=str(new_pk))
+
+        counts['{}.{}'.format(model._meta.label, field.name)] = count
+
+    return counts
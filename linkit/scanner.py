@@ -0,0 +1,146 @@
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+import django
+from django.apps import apps
+from django.core.exceptions import ValidationError
+from django.db import connections
+
+from linkit.types.manager import type_manager
+from linkit.utils import link_target
+
+
+class DanglingLink(NamedTuple):
+    model: str
+    pk: str
+    field: str
+    link_type: str
+    target_pk: str
+    # A 'missing' target or an 'unregistered' link type
+    reason: str = 'missing'
+
+
+class ScanProgress(NamedTuple):
+    rows: int
+    dangling: int
+    chunks_done: int
+    chunks_total: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def chunk_ranges(model_label: str, chunk_size: int) -> List[Tuple]:
+    """ Split the table of the model into (first pk, last pk) ranges of chunk_size rows by only reading the pks. """
+    model = apps.get_model(model_label)
+    pks = model._default_manager.order_by('pk').values_list('pk', flat=True).iterator(chunk_size=chunk_size)
+
+    ranges = []
+    first = last = None
+    count = 0
+    for pk in pks:
+        if first is None:
+            first = pk
+        last = pk
+        count += 1
+        if count >= chunk_size:
+            ranges.append((first, last))
+            first, count = None, 0
+
+    if first is not None:
+        ranges.append((first, last))
+
+    return ranges
+
+
+def check_range(model_label: str, field_name: str, first, last) -> Tuple[int, List[DanglingLink]]:
+    """
+    Check all links of the rows in the given pk range. The targets get grouped per link type and checked with one
+    pk__in query each, links of a type which is not registered are dangling as well. Returns the number of rows
+    checked and the dangling links.
+    """
+    model = apps.get_model(model_label)
+    field = model._meta.get_field(field_name)
+    rows = model._default_manager.filter(pk__gte=first, pk__lte=last).values_list('pk', field.attname)
+
+    count = 0
+    grouped = defaultdict(list)
+    dangling = []
+    for pk, link in rows.iterator():
+        count += 1
+        if link and link.data('type') and link.data('type') not in type_manager:
+            dangling.append(DanglingLink(model_label, str(pk), field_name, link.data('type'), '', 'unregistered'))
+            continue
+
+        target = link_target(link)
+        if target is not None:
+            grouped[target[0]].append((pk, target[1]))
+
+    for identifier, entries in grouped.items():
+        existing = _existing_pks(type_manager.get(identifier).model, {target for pk, target in entries})
+        for pk, target in entries:
+            if target not in existing:
+                dangling.append(DanglingLink(model_label, str(pk), field_name, identifier, target))
+
+    return count, dangling
+
+
+def _existing_pks(model, pks: set) -> set:
+    valid = set()
+    for pk in pks:
+        try:
+            model._meta.pk.to_python(pk)
+            valid.add(pk)
+        except ValidationError:
+            # Not even a valid pk, so it can't exist either
+            pass
+
+    existing = model._default_manager.filter(pk__in=valid).values_list('pk', flat=True)
+    return {str(pk) for pk in existing}
+
+
+def _init_worker():
+    # Workers started with spawn instead of fork need to set up Django on their own
+    if not apps.ready:
+        django.setup()
+
+
+def scan(fields: list, chunk_size: int = 2000, workers: Optional[int] = None,
+         progress: Callable[[ScanProgress], None] = None) -> Iterator[DanglingLink]:
+    """
+    Find all links pointing to a missing target in the given (model, field) list. The tables get split into chunks
+    which are checked in a process pool. With workers=1 everything runs in the current process.
+    """
+    tasks = []
+    for model, field in fields:
+        for first, last in chunk_ranges(model._meta.label, chunk_size):
+            tasks.append((model._meta.label, field.name, first, last))
+
+    started = time.monotonic()
+    rows = dangling_count = done = 0
+
+    def report(result):
+        nonlocal rows, dangling_count, done
+        rows += result[0]
+        dangling_count += len(result[1])
+        done += 1
+        if progress:
+            progress(ScanProgress(rows, dangling_count, done, len(tasks), time.monotonic() - started))
+
+        return result[1]
+
+    if workers == 1:
+        for task in tasks:
+            yield from report(check_range(*task))
+        return
+
+    # Forked workers must not share the database connections of this process
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = [executor.submit(check_range, *task) for task in tasks]
+        for future in as_completed(futures):
+            yield from report(future.result())
@@ -0,0 +1,71 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from django.conf import settings
+
+_scope = ContextVar('linkit_scope', default=None)
+
+
+@contextmanager
+def request_scope():
+    """
+    Everything linkit caches per request lives as long as this scope. The LinkitMiddleware opens one for every
+    request, use it directly in management commands or tasks.
+    """
+    token = _scope.set({})
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+@contextmanager
+def ensure_scope():
+    """ Open a request_scope unless we're already in one. """
+    if _scope.get() is not None:
+        yield
+    else:
+        with request_scope():
+            yield
+
+
+def scoped_cache(namespace: str) -> Optional[dict]:
+    """ A dict living as long as the current scope or None if we're not in one. """
+    scope = _scope.get()
+    if scope is None:
+        return None
+
+    return scope.setdefault(namespace, {})
+
+
+def identity_map() -> Optional[dict]:
+    """
+    Targets loaded in the current scope by (link type identifier, str(pk)), so every target is loaded at most once per
+    request or task. None outside of a scope or if disabled with LINKIT_IDENTITY_MAP = False.
+    """
+    if not getattr(settings, 'LINKIT_IDENTITY_MAP', True):
+        return None
+
+    return scoped_cache('linkit_identity_map')
+
+
+def attach_loaded_target(link, identifier: str, pk) -> bool:
+    """
+    Attach the target another link already loaded in the current scope. Returns False if it isn't in the identity
+    map, the caller loads it then and stores it with remember_target.
+    """
+    targets = identity_map()
+    key = (identifier, str(pk))
+    if pk is None or targets is None or key not in targets:
+        return False
+
+    link.attach(targets[key])
+    return True
+
+
+def remember_target(link, identifier: str, pk):
+    """ Store the target attached to the link (None if missing) in the identity map of the current scope. """
+    targets = identity_map()
+    if pk is not None and targets is not None:
+        targets[(identifier, str(pk))] = link.attached
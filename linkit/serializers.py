@@ -0,0 +1,51 @@
+from typing import Callable, Iterable, Iterator, List, TextIO
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from linkit.link import Link
+from linkit.querysets import prefetch_links, resolve_links
+from linkit.utils import chunked
+
+
+def serialize_links(items: Iterable, *field_names: str) -> List:
+    """
+    Resolve and serialize many links with one query per link type. Pass Link objects to get a list of dicts, or
+    model instances and the names of their LinkFields to get a {field_name: dict} per instance.
+    """
+    items = list(items)
+    if not field_names:
+        resolve_links(items)
+        return [_to_dict(link) for link in items]
+
+    prefetch_links(items, *field_names)
+    return [{name: _to_dict(getattr(item, name)) for name in field_names} for item in items]
+
+
+def _to_dict(link: Link):
+    return link.to_dict() if link else None
+
+
+def iter_json(queryset: models.QuerySet, *field_names: str, row: Callable[[models.Model], dict] = None,
+              chunk_size: int = 500) -> Iterator[str]:
+    """
+    Stream a json array of all rows of the queryset with their resolved links, e.g. for a StreamingHttpResponse.
+    Rows are fetched and resolved chunk by chunk, row(instance) returns the other values of a row (default: pk).
+    """
+    row = row or (lambda instance: {'pk': instance.pk})
+    encoder = DjangoJSONEncoder()
+
+    yield '['
+    first = True
+    for chunk in chunked(queryset.iterator(chunk_size=chunk_size), chunk_size):
+        links = serialize_links(chunk, *field_names)
+        for instance, data in zip(chunk, links):
+            yield ('' if first else ',') + encoder.encode({**row(instance), **data})
+            first = False
+    yield ']'
+
+
+def write_json(stream: TextIO, queryset: models.QuerySet, *field_names: str, **kwargs):
+    """ Write the output of iter_json to a file like object. """
+    for part in iter_json(queryset, *field_names, **kwargs):
+        stream.write(part)
@@ -0,0 +1,15 @@
+from django import template
+
+register = template.Library()
+
+
+@register.simple_tag
+def linkit(link, **attrs):
+    """
+    Render the anchor tag of a link, resolving its target only once:
+    {% load linkit_tags %}{% linkit instance.link class="button" %}
+    """
+    if not link:
+        return ''
+
+    return link.as_html(**attrs)
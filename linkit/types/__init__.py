@@ -1,9 +1,23 @@
-from linkit.types.file import FileType
-from linkit.types.input import InputType
+from importlib import import_module
+
 from linkit.types.manager import type_manager
-from linkit.types.page import PageType
 
-# Register default types we ship out of the box
-type_manager.register(PageType)
-type_manager.register(FileType)
-type_manager.register(InputType)
+# Register default types we ship out of the box. They're imported on first use, so importing linkit (e.g. the
+# LinkField in a models module) doesn't pull in cms and filer.
+type_manager.register('linkit.types.page.PageType', identifier='page')
+type_manager.register('linkit.types.file.FileType', identifier='file')
+type_manager.register('linkit.types.input.InputType', identifier='input')
+
+_LAZY_TYPES = {
+    'PageType': 'linkit.types.page',
+    'FileType': 'linkit.types.file',
+    'InputType': 'linkit.types.input',
+}
+
+
+def __getattr__(name):
+    # Keeps `from linkit.types import PageType` working without importing cms and filer along with linkit.types
+    if name in _LAZY_TYPES:
+        return getattr(import_module(_LAZY_TYPES[name]), name)
+
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
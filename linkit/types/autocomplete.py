@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.forms import Media, Select
+from django.urls import reverse_lazy
+
+from linkit.types.validation import TargetChoiceField
+
+
+def autocomplete_enabled() -> bool:
+    """ Load pages and models on demand instead of rendering all options. Requires linkit.urls to be included. """
+    return getattr(settings, 'LINKIT_AUTOCOMPLETE', False)
+
+
+# Django admins select2 setup, initialised by admin/js/autocomplete.js for all .admin-autocomplete selects
+AUTOCOMPLETE_MEDIA = Media(
+    css={'screen': ['admin/css/vendor/select2/select2.min.css', 'admin/css/autocomplete.css']},
+    js=[
+        'admin/js/vendor/jquery/jquery.min.js',
+        'admin/js/vendor/select2/select2.full.min.js',
+        'admin/js/jquery.init.js',
+        'admin/js/autocomplete.js',
+    ],
+)
+
+
+class AutocompleteSelect(Select):
+    """ Select which only renders the selected option and searches the others with the linkit search view. """
+
+    def __init__(self, identifier: str, attrs: dict = None):
+        attrs = {
+            'class': 'admin-autocomplete',
+            'data-ajax--url': reverse_lazy('linkit:search', kwargs={'identifier': identifier}),
+            'data-allow-clear': 'true',
+            'data-placeholder': '',
+            'data-theme': 'admin-autocomplete',
+            **(attrs or {}),
+        }
+        super().__init__(attrs)
+
+    @property
+    def media(self):
+        return AUTOCOMPLETE_MEDIA
+
+
+def use_autocomplete(form, name: str, queryset, label: str):
+    """
+    Replace the field of the type form with an autocomplete select. While rendering, the queryset only contains the
+    selected object. For validation the full queryset is used.
+    """
+    if not form.is_bound:
+        selected = form.initial.get(name)
+        queryset = queryset.filter(pk=selected) if selected else queryset.none()
+
+    form.fields[name] = TargetChoiceField(
+        queryset=queryset,
+        label=label,
+        required=form.parent_required,
+        widget=AutocompleteSelect(form.link_type.identifier),
+    )
+    form.fields[name].link_type = form.link_type
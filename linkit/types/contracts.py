@@ -1,6 +1,32 @@
-from typing import Optional
+from typing import Callable, Optional
 
-from django.forms import Form
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.forms import Field, Form
+
+from linkit.scope import attach_loaded_target, remember_target
+
+class _Unresolved(object):
+    """
+    Marker for links which didn't get a real value attached (opposing to a None value for a missing target). Links
+    are compared against it by identity, so it stays the same object when links get copied or pickled.
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'UNRESOLVED'
+
+    def __reduce__(self):
+        return 'UNRESOLVED'
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+UNRESOLVED = _Unresolved()
 
 
 class LinkType(object):
@@ -9,6 +35,19 @@ class LinkType(object):
     type_label = None
     form_class = None
 
+    # Link types pointing to a database row set the model and the key under which the pk is stored in the value dict.
+    # This enables batch resolving in prefetch_links.
+    model = None
+    value_key = None
+
+    # Structure of the stored value for the form-free validation in linkit.types.validation.validate_links: all keys
+    # are required and hold one of the given types. Types with a value_key default to {value_key: (int, str)}.
+    schema = None
+
+    # Set to True if href and label don't hit the database once the real value is loaded. Links of these types can
+    # be resolved in async code without a thread hop.
+    async_safe = False
+
     def __init__(self, link):
         self.link = link
 
@@ -18,9 +57,7 @@ class LinkType(object):
         instance_form method if you have an actual instance.
         """
         data = data or self.link.data('value', {})
-        link_name = link_name or self.link.name
-
-        kwargs = {'prefix': f'{link_name}_link_{self.identifier}', 'link_type': self, 'required': required}
+        kwargs = {'prefix': self.form_prefix(link_name), 'link_type': self, 'required': required}
 
         if initial:
             kwargs['initial'] = data
@@ -29,6 +66,9 @@ class LinkType(object):
 
         return self.form_class(**kwargs)
 
+    def form_prefix(self, link_name: str = None) -> str:
+        return f'{link_name or self.link.name}_link_{self.identifier}'
+
     @property
     def value(self):
         """
@@ -40,6 +80,19 @@ class LinkType(object):
 
         return None
 
+    @property
+    def pk(self):
+        """
+        Primary key of the linked object as stored in the json or None if this type doesn't link to a model. Right
+        after the form cleaned the link, the value holds the object itself instead of its pk.
+        """
+        value = self.link.data('value')
+        if self.value_key and isinstance(value, dict):
+            target = value.get(self.value_key)
+            return getattr(target, 'pk', target) or None
+
+        return None
+
     @property
     def href(self) -> Optional[str]:
         """ Returns the href of the real_value. """
@@ -62,6 +115,161 @@ class LinkType(object):
         """ Returns the actual value selected. E.g. a Page or a FilerFile instance. """
         raise NotImplementedError
 
+    def memoized(self, loader: Callable):
+        """
+        Returns the real value memoized on the link (attached by prefetch_links or by a previous call) or calls the
+        loader and memoizes its result, including None for a missing target. Values are only memoized on the link
+        if it's actually of our type. Within a request scope, targets loaded for other links are reused.
+        """
+        if self.link.data('type') != self.identifier:
+            return loader()
+
+        if self.link.attached is UNRESOLVED and not attach_loaded_target(self.link, self.identifier, self.pk):
+            self.link.attach(loader())
+            remember_target(self.link, self.identifier, self.pk)
+
+        return self.link.attached
+
+    @classmethod
+    def resolve_many(cls, pks: list) -> Optional[dict]:
+        """
+        Batch-resolve hook used by prefetch_links. Gets the pks of all links of this type and returns a dict mapping
+        str(pk) to the real value. Missing keys are treated as missing targets. The default implementation fetches
+        the model with one pk__in query. Return None if the type can't be resolved in bulk.
+        """
+        if cls.model is None:
+            return None
+
+        return {str(pk): obj for pk, obj in cls.model._default_manager.in_bulk(pks).items()}
+
+    async def areal_value(self):
+        """ Async counterpart of real_value. """
+        if self.model is None or self.pk is None:
+            return await sync_to_async(self.real_value)()
+
+        if self.link.data('type') != self.identifier:
+            return await self.model._default_manager.filter(pk=self.pk).afirst()
+
+        if self.link.attached is UNRESOLVED and not attach_loaded_target(self.link, self.identifier, self.pk):
+            self.link.attach(await self.model._default_manager.filter(pk=self.pk).afirst())
+            remember_target(self.link, self.identifier, self.pk)
+
+        return self.link.attached
+
+    @classmethod
+    async def aresolve_many(cls, pks: list) -> Optional[dict]:
+        """ Async counterpart of resolve_many. Types overwriting resolve_many get it called in a thread. """
+        if cls.resolve_many.__func__ is not LinkType.resolve_many.__func__:
+            return await sync_to_async(cls.resolve_many)(pks)
+
+        if cls.model is None:
+            return None
+
+        values = await cls.model._default_manager.ain_bulk(pks)
+        return {str(pk): obj for pk, obj in values.items()}
+
+    @classmethod
+    def build_value(cls, target) -> dict:
+        """ The value stored for the given target, e.g. a model instance or pk. Used by Link.build. """
+        if cls.value_key is None:
+            raise NotImplementedError
+
+        return {cls.value_key: getattr(target, 'pk', target)}
+
+    @classmethod
+    def validate_value(cls, value) -> Optional[str]:
+        """ Check the structure of a stored value against the schema without building the form. Returns the error. """
+        schema = cls.schema
+        if schema is None and cls.value_key:
+            schema = {cls.value_key: (int, str)}
+        if schema is None:
+            return None
+
+        if not isinstance(value, dict):
+            return 'Value must be a dict'
+
+        unknown = set(value) - set(schema)
+        if unknown:
+            return 'Unknown keys: {}'.format(', '.join(sorted(unknown)))
+
+        for key, types in schema.items():
+            types = types if isinstance(types, tuple) else (types,)
+            if value.get(key) in (None, ''):
+                return 'Missing {}'.format(key)
+            if not isinstance(value[key], types) or (isinstance(value[key], bool) and bool not in types):
+                return 'Invalid {}: {!r}'.format(key, value[key])
+
+        return None
+
+    def queryset(self):
+        """ The objects which can be selected, None if this type doesn't link to a model. """
+        if self.model is None:
+            return None
+
+        return self.model._default_manager.all()
+
+    def target_field(self) -> Optional[Field]:
+        """ The form field selecting the target, None if the type doesn't link to a model. """
+        if self.value_key is None or self.form_class is None:
+            return None
+
+        return self.form_class.base_fields.get(self.value_key)
+
+    def submitted_pk(self):
+        """
+        The pk chosen in the submitted, not yet cleaned value, read from the data by the prefix of the type form
+        without building it. Fields with multiple widgets pick the pk with their target_pk method. Used to validate
+        many links at once.
+        """
+        field = self.target_field()
+        if field is None:
+            return None
+
+        name = '{}-{}'.format(self.form_prefix(), self.value_key)
+        value = field.widget.value_from_datadict(self.link.data('value', {}), {}, name)
+        if hasattr(field, 'target_pk'):
+            value = field.target_pk(value)
+        elif isinstance(value, (list, tuple)):
+            return None
+
+        return value or None
+
+    def valid_targets(self, pks: list) -> Optional[dict]:
+        """
+        Batch existence check used by the LinkFormSetMixin. Gets the submitted pks of all links of this type and
+        returns {str(pk): obj} for the valid ones with a single query. Return None if the type can't validate in bulk.
+        """
+        queryset = self.queryset()
+        if queryset is None:
+            return None
+
+        pk_field = queryset.model._meta.pk
+        valid = []
+        for pk in pks:
+            try:
+                valid.append(pk_field.to_python(pk))
+            except ValidationError:
+                pass
+
+        return {str(obj.pk): obj for obj in queryset.filter(pk__in=valid)}
+
+    def search(self, term: str, offset: int, limit: int) -> list:
+        """ List of (pk, label) tuples matching the search term, used by the autocomplete of the widget. """
+        return []
+
+    @classmethod
+    def watches(cls, sender) -> bool:
+        """ If saving or deleting instances of the given model may change the href or label of our targets. """
+        return cls.model is not None and issubclass(sender, cls.model)
+
+    @classmethod
+    def affected_pks(cls, instance, deleted: bool = False) -> list:
+        """ The pks of our targets whose href or label may change if the given instance gets saved or deleted. """
+        if cls.model is not None and isinstance(instance, cls.model):
+            return [instance.pk]
+
+        return []
+
     def render(self):
         # We ignore the required parameter since in this case we're just rendering the form and
         # won't do any validation.
@@ -81,3 +289,4 @@ class TypeForm(Form):
 
         for index, field in self.fields.items():
             field.required = self.parent_required
+            field.link_type = self.link_type
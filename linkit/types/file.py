@@ -1,11 +1,77 @@
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional
 
+from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from filer.fields.file import AdminFileFormField
 from filer.models import File
 
+from linkit.cache import MISSING, ResolutionCache
 from linkit.models import FakeLink
-from linkit.types.contracts import LinkType, TypeForm
+from linkit.types.contracts import UNRESOLVED, LinkType, TypeForm
+
+# Opt-in cache of file urls, configured with LINKIT_FILE_URL_CACHE (same options as LINKIT_CACHE)
+file_url_cache = ResolutionCache(namespace='linkit_file_url', setting='LINKIT_FILE_URL_CACHE', per_language=False)
+
+
+def _storages() -> list:
+    field = File._meta.get_field('file')
+    return list(getattr(field, 'storages', {}).values()) or [field.storage]
+
+
+@lru_cache(maxsize=None)
+def storage_key() -> str:
+    """ Identifies the storages of filer, so urls get cached separately as soon as they change. """
+    return '|'.join('{}.{}:{}'.format(
+        storage.__class__.__module__,
+        storage.__class__.__name__,
+        getattr(storage, 'bucket_name', None) or getattr(storage, 'location', ''),
+    ) for storage in _storages())
+
+
+def url_timeout() -> int:
+    """
+    Seconds a file url may be cached. Signed urls (e.g. django-storages with querystring_auth) expire, so we stay
+    well below their expiry. Can be set with LINKIT_FILE_URL_TTL.
+    """
+    timeout = getattr(settings, 'LINKIT_FILE_URL_TTL', None)
+    if timeout is not None:
+        return timeout
+
+    timeout = 60 * 60
+    for storage in _storages():
+        if getattr(storage, 'querystring_auth', False):
+            timeout = min(timeout, int(getattr(storage, 'querystring_expire', 3600) * 0.8))
+
+    return timeout
+
+
+def file_urls(pks: Iterable) -> dict:
+    """
+    Urls of many files {str(pk): url}, missing files are left out. Cached urls are used if the cache is enabled,
+    the others are generated from a single query of the non polymorphic files. It's limited to the columns needed
+    for the url, but filer still adds the few it reads on init (_file_size, sha1, polymorphic_ctype).
+    """
+    pks = {str(pk) for pk in pks if pk}
+    urls = {}
+    if file_url_cache.enabled:
+        for pk in pks:
+            cached = file_url_cache.get(storage_key(), pk)
+            if cached is not MISSING:
+                urls[pk] = cached
+
+    missing = pks - set(urls)
+    if missing:
+        files = File.objects.non_polymorphic().filter(pk__in=missing).only('id', 'file', 'is_public')
+        generated = {str(file.pk): file.url for file in files}
+        if file_url_cache.enabled:
+            # Missing files are cached as None, the timeout keeps signed urls from expiring in the cache
+            timeout = url_timeout()
+            for pk in missing:
+                file_url_cache.set(storage_key(), pk, generated.get(pk), timeout)
+        urls.update(generated)
+
+    return {pk: url for pk, url in urls.items() if url}
 
 
 class LinkItFilerField(AdminFileFormField):
@@ -27,10 +93,6 @@ class LinkItFilerField(AdminFileFormField):
 
 
 class FileTypeForm(TypeForm):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields['file'].link_type = self.link_type
-
     file = LinkItFilerField(queryset=None, to_field_name=None)
 
 
@@ -38,9 +100,16 @@ class FileType(LinkType):
     identifier = 'file'
     type_label = _('File')
     form_class = FileTypeForm
+    model = File
+    value_key = 'file'
+    async_safe = True
 
     @property
     def href(self):
+        # Without a loaded file, use the url cache which doesn't need the whole row
+        if file_url_cache.enabled and self.pk is not None and self.link.attached is UNRESOLVED:
+            return file_urls([self.pk]).get(str(self.pk), False)
+
         real_value = self.real_value()
         if real_value:
             return real_value.url
@@ -56,4 +125,8 @@ class FileType(LinkType):
         return False
 
     def real_value(self) -> Optional[File]:
-        return File.objects.filter(pk=self.link.data('value').get('file')).first()
+        return self.memoized(lambda: File.objects.filter(pk=self.pk).first())
+
+    def valid_targets(self, pks: list) -> Optional[dict]:
+        # The filer field doesn't check the submitted file, so there's nothing to preload
+        return None
@@ -15,6 +15,20 @@ class InputType(LinkType):
     identifier = 'input'
     type_label = _('externer Link')
     form_class = InputTypeForm
+    schema = {'input': str}
+    async_safe = True
+
+    @classmethod
+    def build_value(cls, target) -> dict:
+        return {'input': target}
+
+    @classmethod
+    def validate_value(cls, value) -> Optional[str]:
+        error = super().validate_value(value)
+        if error is None and len(value['input']) > InputTypeForm.base_fields['input'].max_length:
+            return 'Url too long'
+
+        return error
 
     @property
     def href(self):
@@ -27,3 +41,6 @@ class InputType(LinkType):
     def real_value(self) -> Optional[str]:
         return self.link.data('value').get('input')
 
+    async def areal_value(self) -> Optional[str]:
+        return self.real_value()
+
@@ -1,7 +1,8 @@
 from json import JSONEncoder
-from typing import Type
+from typing import Type, Union
 
 from django.db import models
+from django.utils.module_loading import import_string
 
 from linkit.types.contracts import LinkType
 
@@ -29,21 +30,46 @@ class LinkTypeManager(object):
             raise ValueError(
                 'Invalid type "{}". Make sure to register it in the LinkTypeManager before using.'.format(identifier))
 
-        return self._types[identifier]
+        link_type = self._types[identifier]
+        if isinstance(link_type, str):
+            # Registered by dotted path, import it on first use
+            link_type = self._types[identifier] = import_string(link_type)
+
+        return link_type
+
+    def __contains__(self, identifier: str) -> bool:
+        return identifier in self._types
+
+    def all(self) -> list:
+        """ All registered link types. Imports the ones registered by dotted path. """
+        return [self.get(identifier) for identifier in list(self._types)]
+
+    def loaded(self) -> list:
+        """ The registered link types which are already imported, without importing the ones registered by path. """
+        return [link_type for link_type in list(self._types.values()) if not isinstance(link_type, str)]
 
     def instance(self, identifier: str, link):
         return self.get(identifier)(link)
 
-    def register(self, link_type: Type[LinkType]):
-        self._types[link_type.identifier] = link_type
+    def register(self, link_type: Union[Type[LinkType], str], identifier: str = None):
+        """
+        Register a link type class or its dotted path together with the identifier. Types registered by path are
+        only imported when they're used, so importing linkit doesn't import the apps behind them (e.g. cms).
+        """
+        if isinstance(link_type, str):
+            if not identifier:
+                raise ValueError('Link types registered by path need an identifier: {}'.format(link_type))
+            self._types[identifier] = link_type
+        else:
+            self._types[identifier or link_type.identifier] = link_type
 
     def type_choices(self, limit_to: list) -> list:
         """ Transform possible registered types to a usable format for the ChoicesField. """
         result = {}
-        for identifier, type in self._types.items():
+        for identifier in list(self._types):
             if identifier not in limit_to:
                 continue
-            result[identifier] = type.type_label
+            result[identifier] = self.get(identifier).type_label
 
         return list(result.items())
 
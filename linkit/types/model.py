@@ -1,25 +1,48 @@
-from django.forms import ModelChoiceField
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+from django.db.models import Q
 from django.utils.encoding import force_str
 
+from linkit.types.autocomplete import autocomplete_enabled, use_autocomplete
 from linkit.types.contracts import TypeForm, LinkType
+from linkit.types.validation import TargetChoiceField
 
 
 class ModelTypeForm(TypeForm):
     def __init__(self, *args, **kwargs):
         """ Set the queryset and label dynamically based on the properties defined on the link type. """
         super().__init__(*args, **kwargs)
-        self.fields['model'].queryset = self.link_type.queryset()
-        self.fields['model'].label = force_str(self.link_type.model._meta.verbose_name)
+        label = force_str(self.link_type.model._meta.verbose_name)
+        if autocomplete_enabled():
+            use_autocomplete(self, 'model', self.link_type.queryset(), label)
+        else:
+            self.fields['model'].queryset = self.link_type.queryset()
+            self.fields['model'].label = label
 
-    model = ModelChoiceField(queryset=None)
+    model = TargetChoiceField(queryset=None)
 
 
 class ModelLinkType(LinkType):
     model = None
     form_class = ModelTypeForm
+    value_key = 'model'
+
+    # Fields searched by the autocomplete and the only ones loaded for it. Without search_fields the first CharField of
+    # the model is searched, loads everything if search_only is None.
+    search_fields = ()
+    search_only = None
+
+    @property
+    def pk(self):
+        # The ModelTypeForm stores {'model': pk} but we still support plain pk values
+        value = self.link.data('value')
+        if isinstance(value, dict):
+            return super().pk
+
+        return getattr(value, 'pk', value) or None
 
     def real_value(self):
-        return self.model.objects.filter(pk=self.link.data('value')).first()
+        return self.memoized(lambda: self.model.objects.filter(pk=self.pk).first())
 
     @property
     def href(self):
@@ -39,3 +62,29 @@ class ModelLinkType(LinkType):
 
     def queryset(self):
         return self.model.objects.all()
+
+    def get_search_fields(self) -> list:
+        if self.search_fields:
+            return list(self.search_fields)
+
+        for field in self.model._meta.fields:
+            if isinstance(field, models.CharField) and not field.choices:
+                return [field.name]
+
+        raise ImproperlyConfigured('{} has no CharField to search, set search_fields.'.format(type(self).__name__))
+
+    def search(self, term: str, offset: int, limit: int) -> list:
+        queryset = self.queryset()
+        if term:
+            query = Q()
+            for field in self.get_search_fields():
+                query |= Q(**{f'{field}__icontains': term})
+            queryset = queryset.filter(query)
+
+        if not queryset.ordered:
+            queryset = queryset.order_by('pk')
+
+        if self.search_only is not None:
+            queryset = queryset.only(*self.search_only)
+
+        return [(obj.pk, str(obj)) for obj in queryset[offset:offset + limit]]
@@ -1,46 +1,222 @@
+from functools import lru_cache
 from importlib.metadata import PackageNotFoundError, version
-from typing import Optional
+from typing import Iterable, Optional
 
 from cms.forms.fields import PageSelectFormField
 from cms.models import Page
-from django.utils.translation import gettext_lazy as _
-from pkg_resources import parse_version
+from django.core.exceptions import ValidationError
+from django.urls import reverse
+from django.utils.translation import get_language, gettext_lazy as _, override
 
+from linkit.cache import MISSING
+from linkit.types.autocomplete import autocomplete_enabled, use_autocomplete
 from linkit.types.contracts import LinkType, TypeForm
+from linkit.types.validation import TargetChoiceField, preloaded_target
 
-try:
-    cms_version = version("django-cms")
-except PackageNotFoundError:
-    cms_version = None
+
+@lru_cache(maxsize=None)
+def is_cms4() -> bool:
+    """ Checked on first use from the installed metadata, without importing pkg_resources. """
+    try:
+        return int(version('django-cms').split('.')[0]) >= 4
+    except (PackageNotFoundError, ValueError):
+        return False
+
+
+def page_urls(pks: Iterable, language: str) -> dict:
+    """
+    Url and title of the given pages in one language, with one query for django CMS 3 (titles) and two for django
+    CMS 4 (urls and contents). Pages without a translation are missing in the result.
+    """
+    if is_cms4():
+        from cms.models import PageContent, PageUrl
+        rows = PageUrl.objects.filter(page_id__in=pks, language=language).values_list(
+            'page_id', 'path', 'page__is_home')
+        titles = dict(PageContent.objects.filter(page_id__in=pks, language=language).values_list('page_id', 'title'))
+        rows = [(page_id, path, is_home, titles.get(page_id)) for page_id, path, is_home in rows]
+    else:
+        from cms.models import Title
+        rows = Title.objects.filter(page_id__in=pks, language=language).values_list(
+            'page_id', 'path', 'page__is_home', 'title')
+
+    urls = {}
+    with override(language):
+        for page_id, path, is_home, title in rows:
+            if is_home:
+                url = reverse('pages-root')
+            else:
+                url = reverse('pages-details-by-slug', kwargs={'slug': path})
+            urls[page_id] = (url, title)
+
+    return urls
+
+
+def attach_urls(pages: Iterable[Page], language: str = None):
+    """
+    Load the urls and titles of the pages in the given (default: current) language and remember them on the pages,
+    so PageType doesn't need to ask django CMS page by page. Untranslated pages fall back to django CMS.
+    """
+    language = language or get_language()
+    pages = [page for page in pages if language not in getattr(page, '_linkit_urls', {})]
+    if not pages:
+        return
+
+    urls = page_urls([page.pk for page in pages], language)
+    for page in pages:
+        if not hasattr(page, '_linkit_urls'):
+            page._linkit_urls = {}
+        page._linkit_urls[language] = urls.get(page.pk)
+
+
+class PageTargetField(PageSelectFormField):
+    """ PageSelectFormField using the pages preloaded by the LinkFormSetMixin instead of querying them one by one. """
+    link_type = None
+
+    @staticmethod
+    def target_pk(data_list):
+        """ The page of the site and page select, also used by LinkType.submitted_pk. """
+        return data_list[1] if data_list and len(data_list) > 1 else None
+
+    def compress(self, data_list):
+        pk = self.target_pk(data_list)
+        if pk:
+            page = preloaded_target(self.link_type, pk)
+            if page is None:
+                raise ValidationError(self.error_messages.get('invalid_page', self.error_messages['invalid']),
+                                      code='invalid_page')
+            if page is not MISSING:
+                return page
+
+        return super().compress(data_list)
 
 
 class PageTypeForm(TypeForm):
     def __init__(self, *args, **kwargs):
         """ Set the queryset and label dynamically based on the properties defined on the link type. """
         super().__init__(*args, **kwargs)
-        self.fields['page'].to_field_name = self.link_type.id
-        if cms_version and parse_version(cms_version) >= parse_version("4.0.0"):
-            queryset = Page.objects.all()
+        queryset = self.link_type.queryset()
+
+        if autocomplete_enabled():
+            use_autocomplete(self, 'page', queryset, _('Page'))
         else:
-            queryset = Page.objects.drafts()
-        self.fields["page"].queryset = queryset
+            self.fields['page'].to_field_name = self.link_type.id
+            self.fields["page"].queryset = queryset
 
-    page = PageSelectFormField(queryset=Page.objects.none(), to_field_name=None)
+    page = PageTargetField(queryset=Page.objects.none(), to_field_name=None)
 
 
 class PageType(LinkType):
     identifier = 'page'
     type_label = _('CMS Seite')
     form_class = PageTypeForm
+    model = Page
+    value_key = 'page'
+
+    @classmethod
+    def watches(cls, sender) -> bool:
+        """ Pages and their title/url models. """
+        return issubclass(sender, Page) or (sender._meta.app_label == 'cms' and hasattr(sender, 'page_id'))
+
+    @classmethod
+    def affected_pks(cls, instance, deleted: bool = False) -> list:
+        """
+        Saving a page or one of its title/url models changes the urls of all its descendants as well. Deleted
+        descendants send their own signals.
+        """
+        if deleted:
+            return super().affected_pks(instance, deleted)
+
+        page = instance if isinstance(instance, Page) else None
+        if page is None and instance._meta.app_label == 'cms' and hasattr(instance, 'page_id'):
+            page = instance.page
+
+        if page is None or page.pk is None:
+            return []
+
+        return [page.pk] + list(page.get_descendant_pages().values_list('pk', flat=True))
+
+    def queryset(self):
+        if is_cms4():
+            return Page.objects.all()
+
+        return Page.objects.drafts()
+
+    def target_field(self):
+        if autocomplete_enabled():
+            # The form replaces the page select with an autocomplete, see PageTypeForm
+            return TargetChoiceField(queryset=None)
+
+        return super().target_field()
+
+    @classmethod
+    def build_value(cls, target) -> dict:
+        """ Links point to the draft on django CMS 3, so public pages are replaced by it. """
+        if isinstance(target, Page) and not is_cms4() and not target.publisher_is_draft:
+            return {cls.value_key: target.publisher_public_id}
+
+        return super().build_value(target)
+
+    def valid_targets(self, pks: list) -> Optional[dict]:
+        """ On django CMS 3 the pks of public pages are valid too, they're mapped to their draft. """
+        valid = super().valid_targets(pks)
+        missing = [pk for pk in pks if str(pk) not in valid]
+        if is_cms4() or not missing:
+            return valid
+
+        public = []
+        for pk in missing:
+            try:
+                public.append(Page._meta.pk.to_python(pk))
+            except ValidationError:
+                pass
+
+        for draft in Page.objects.drafts().filter(publisher_public__in=public):
+            valid[str(draft.publisher_public_id)] = draft
+
+        return valid
+
+    def search(self, term: str, offset: int, limit: int) -> list:
+        """ Search the titles of the current language directly instead of loading the pages. """
+        if is_cms4():
+            from cms.models import PageContent
+            titles = getattr(PageContent, 'admin_manager', PageContent.objects).all()
+            if hasattr(titles, 'current_content'):
+                titles = titles.current_content()
+        else:
+            from cms.models import Title
+            titles = Title.objects.filter(publisher_is_draft=True)
+
+        titles = titles.filter(language=get_language())
+        if term:
+            titles = titles.filter(title__icontains=term)
+
+        return list(titles.order_by('title', 'page_id').values_list('page_id', 'title')[offset:offset + limit])
+
+    @classmethod
+    def resolve_many(cls, pks: list) -> Optional[dict]:
+        """ Fetch the pages together with their urls and titles in the current language. """
+        pages = super().resolve_many(pks)
+        attach_urls(pages.values())
+        return pages
 
     def real_value(self) -> Optional[Page]:
-        return Page.objects.filter(pk=self.link.data('value').get('page')).first()
+        return self.memoized(lambda: Page.objects.filter(pk=self.pk).first())
+
+    def url_and_title(self) -> Optional[tuple]:
+        """ Url and title of the page in the current language, loaded in bulk if the page was prefetched. """
+        page = self.real_value()
+        if not page:
+            return None
+
+        attach_urls([page])
+        return page._linkit_urls[get_language()]
 
     @property
     def href(self):
         real_value = self.real_value()
         if real_value:
-            return real_value.get_absolute_url()
+            url_and_title = self.url_and_title()
+            return url_and_title[0] if url_and_title else real_value.get_absolute_url()
 
         return False
 
@@ -48,6 +224,11 @@ class PageType(LinkType):
     def label(self):
         real_value = self.real_value()
         if real_value:
-            return real_value.get_content_obj()
+            url_and_title = self.url_and_title()
+            if url_and_title and url_and_title[1]:
+                return url_and_title[1]
+
+            # Untranslated pages fall back to django CMS, which has no get_content_obj before version 4
+            return real_value.get_content_obj() if is_cms4() else real_value.get_title()
 
         return False
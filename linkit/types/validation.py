@@ -0,0 +1,126 @@
+from collections import defaultdict
+from typing import Iterable, List, NamedTuple
+
+from django.core.exceptions import ValidationError
+from django.forms import ModelChoiceField
+
+from linkit.cache import MISSING
+from linkit.scope import scoped_cache
+from linkit.types.manager import type_manager
+
+
+class LinkError(NamedTuple):
+    index: int      # Position of the link in the validated list
+    link: object
+    message: str
+
+
+def validate_links(links: Iterable, chunk_size: int = 2000) -> List[LinkError]:
+    """
+    Validate many links without building a form per link, e.g. before a bulk_create: the type has to be registered
+    and allowed by the config, the value has to match the schema of the type and the targets have to exist, which
+    is checked with one pk__in query per type (and chunk_size targets). Types without valid_targets (e.g. files) are
+    checked with resolve_many. Returns the errors, empty links are skipped.
+    """
+    links = list(links)
+    errors = []
+    grouped = defaultdict(lambda: defaultdict(list))
+    link_types = {}
+    for index, link in enumerate(links):
+        if not link or not link.data('type'):
+            continue
+
+        identifier = link.data('type')
+        if identifier not in type_manager:
+            errors.append(LinkError(index, link, 'Unknown type {}'.format(identifier)))
+            continue
+        if link.config('types') and identifier not in link.config('types'):
+            errors.append(LinkError(index, link, 'Type {} is not allowed'.format(identifier)))
+            continue
+
+        type_class = type_manager.get(identifier)
+        message = type_class.validate_value(link.data('value'))
+        if message:
+            errors.append(LinkError(index, link, message))
+            continue
+
+        link_type = link.link_type
+        if link_type.model is not None and link_type.pk is not None:
+            grouped[identifier][str(link_type.pk)].append(index)
+            link_types[identifier] = link_type
+
+    for identifier, targets in grouped.items():
+        pks = list(targets)
+        for start in range(0, len(pks), chunk_size):
+            chunk = pks[start:start + chunk_size]
+            valid = link_types[identifier].valid_targets(chunk)
+            if valid is None:
+                valid = type(link_types[identifier]).resolve_many(chunk)
+            if valid is None:
+                continue
+
+            for pk in chunk:
+                if pk not in valid:
+                    errors.extend(LinkError(index, links[index], '{} {} does not exist'.format(identifier, pk))
+                                  for index in targets[pk])
+
+    return sorted(errors, key=lambda error: error.index)
+
+
+def preload_targets(links: Iterable):
+    """
+    Check the submitted targets of many links with one query per link type and remember the result in the current
+    scope, where the fields of the type forms pick them up. Used by the LinkFormSetMixin.
+    """
+    cache = scoped_cache('linkit_targets')
+    if cache is None:
+        return
+
+    grouped = defaultdict(set)
+    link_types = {}
+    for link in links:
+        if link.data('type') not in type_manager:
+            continue
+
+        link_type = link.link_type
+        pk = link_type.submitted_pk()
+        if pk is not None:
+            grouped[link_type.identifier].add(str(pk))
+            link_types[link_type.identifier] = link_type
+
+    for identifier, pks in grouped.items():
+        pks = [pk for pk in pks if (identifier, pk) not in cache]
+        valid = link_types[identifier].valid_targets(pks) if pks else None
+        if valid is None:
+            continue
+
+        for pk in pks:
+            cache[(identifier, pk)] = valid.get(pk)
+
+
+def preloaded_target(link_type, pk):
+    """ The target preloaded by preload_targets, None if it's invalid or MISSING if it didn't get preloaded. """
+    cache = scoped_cache('linkit_targets')
+    if cache is None or link_type is None:
+        return MISSING
+
+    return cache.get((link_type.identifier, str(getattr(pk, 'pk', pk))), MISSING)
+
+
+class TargetChoiceField(ModelChoiceField):
+    """ ModelChoiceField using the targets preloaded by preload_targets instead of querying them one by one. """
+    link_type = None
+
+    def to_python(self, value):
+        if value in self.empty_values or self.to_field_name not in (None, 'pk'):
+            return super().to_python(value)
+
+        target = preloaded_target(self.link_type, value)
+        if target is MISSING:
+            return super().to_python(value)
+
+        if target is None:
+            raise ValidationError(self.error_messages['invalid_choice'], code='invalid_choice',
+                                  params={'value': value})
+
+        return target
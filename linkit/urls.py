@@ -0,0 +1,10 @@
+from django.urls import path
+
+from linkit import views
+
+app_name = 'linkit'
+
+urlpatterns = [
+    path('search/<str:identifier>/', views.search, name='search'),
+    path('panel/', views.panel, name='panel'),
+]
@@ -0,0 +1,129 @@
+from typing import Iterable, Iterator, List, Optional, Tuple, Type
+
+from django.apps import apps
+from django.conf import settings
+from django.db import models
+from django.db.models import F, Q
+from django.db.models.lookups import In
+
+from linkit.link import Link
+from linkit.lookups import LinkTargetTransform
+from linkit.model_fields import LinkField
+from linkit.querysets import resolve_links
+from linkit.types.contracts import LinkType
+from linkit.types.manager import type_manager
+
+
+def link_fields(**config) -> List[Tuple[Type[models.Model], LinkField]]:
+    """
+    All concrete LinkFields of all installed models, optionally filtered by config options (e.g. snapshot=True). Each
+    field is only listed with the model declaring it, not with its proxies or multi-table children.
+    """
+    result = []
+    for model in apps.get_models():
+        for field in model._meta.concrete_fields:
+            if not isinstance(field, LinkField) or field.model is not model:
+                continue
+            if all(field.config.get(key) == value for key, value in config.items()):
+                result.append((model, field))
+
+    return result
+
+
+def changed_link_fields(instance: models.Model) -> List[str]:
+    """ Names of the loaded LinkFields of the instance whose link got changed or replaced since it was loaded. """
+    changed = []
+    for field in instance._meta.concrete_fields:
+        if isinstance(field, LinkField) and field.attname in instance.__dict__:
+            link = instance.__dict__[field.attname]
+            if not isinstance(link, Link) or link.changed:
+                changed.append(field.name)
+
+    return changed
+
+
+def skip_unchanged_links(instance: models.Model, update_fields: Iterable[str] = None) -> List[str]:
+    """
+    The update_fields (default: all concrete fields) without the LinkFields whose link wasn't changed, e.g.
+    instance.save(update_fields=skip_unchanged_links(instance)) or bulk_update(instances, skip_unchanged_links(...)).
+    """
+    if update_fields is None:
+        update_fields = [field.name for field in instance._meta.concrete_fields if not field.primary_key]
+
+    changed = set(changed_link_fields(instance))
+    unchanged = {field.name for field in instance._meta.concrete_fields
+                 if isinstance(field, LinkField) and field.name not in changed}
+    return [name for name in update_fields if name not in unchanged]
+
+
+def link_target(link: Optional[Link]) -> Optional[Tuple[str, str]]:
+    """ The (link type, target pk) of the link or None if it doesn't point to a database row. """
+    if not link or link.data('type') not in type_manager:
+        return None
+
+    pk = link.link_type.pk
+    if pk is None or link.link_type.model is None:
+        return None
+
+    return link.data('type'), str(pk)
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    """ Split the iterable into lists of the given size without consuming it at once. """
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def referencing_query(field_name: str, link_type: Type[LinkType], pks: Iterable) -> Q:
+    """ Rows whose link points to one of the given targets of the link type. """
+    target = LinkTargetTransform(F(field_name), link_type=link_type.identifier)
+    return Q(**{f'{field_name}__type': link_type.identifier}) & Q(In(target, [str(pk) for pk in pks]))
+
+
+def referencing_rows(model: Type[models.Model], field: LinkField, link_type: Type[LinkType],
+                     pks: Iterable) -> Iterator[models.Model]:
+    """ Instances of the model whose link field points to one of the given targets. """
+    pks = {str(pk) for pk in pks}
+    if not pks or not link_type.value_key:
+        return
+
+    queryset = model._default_manager.filter(referencing_query(field.attname, link_type, pks))
+    yield from queryset.only(model._meta.pk.attname, field.attname).iterator()
+
+
+def snapshot_languages() -> list:
+    """ Languages to take snapshots for when refreshing them in bulk. """
+    return getattr(settings, 'LINKIT_SNAPSHOT_LANGUAGES', None) or [code for code, name in settings.LANGUAGES]
+
+
+def refresh_snapshots(instances: Iterable[models.Model], field: LinkField, languages: list = None,
+                      chunk_size: int = 500) -> int:
+    """
+    Take a new snapshot of the given field for all instances and store them chunk by chunk with bulk_update.
+    Returns the number of updated rows.
+    """
+    count = 0
+    for chunk in chunked(instances, chunk_size):
+        count += _refresh_snapshot_chunk(chunk, field, languages)
+
+    return count
+
+
+def _refresh_snapshot_chunk(instances: list, field: LinkField, languages: list = None) -> int:
+    links = [getattr(instance, field.attname) for instance in instances]
+    resolve_links(links)
+
+    for link in links:
+        if link.set:
+            link.take_snapshot(languages)
+
+    type(instances[0])._default_manager.bulk_update(instances, [field.attname])
+
+    return len(instances)
@@ -0,0 +1,58 @@
+import re
+
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core import signing
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, HttpResponse, JsonResponse
+
+from linkit.link import Link
+from linkit.types.manager import type_manager
+from linkit.widgets import empty_panel
+
+PAGE_SIZE = 20
+
+
+@staff_member_required
+def search(request, identifier: str):
+    """
+    Paginated search for the autocomplete of the LinkWidget, responds in the format select2 expects. Like the admin,
+    it requires the view or change permission on the model of the link type.
+    """
+    if identifier not in type_manager:
+        raise Http404
+
+    model = type_manager.get(identifier).model
+    if model is not None:
+        opts = model._meta
+        if not any(request.user.has_perm('{}.{}_{}'.format(opts.app_label, action, opts.model_name))
+                   for action in ('view', 'change')):
+            raise PermissionDenied
+
+    try:
+        page = max(int(request.GET.get('page', 1)), 1)
+    except ValueError:
+        page = 1
+
+    link_type = type_manager.instance(identifier, Link(config={}))
+    results = link_type.search(request.GET.get('term', ''), (page - 1) * PAGE_SIZE, PAGE_SIZE + 1)
+
+    return JsonResponse({
+        'results': [{'id': str(pk), 'text': str(label)} for pk, label in results[:PAGE_SIZE]],
+        'pagination': {'more': len(results) > PAGE_SIZE},
+    })
+
+
+@staff_member_required
+def panel(request):
+    """ Empty markup of a type form, loaded by the LinkWidget as soon as the editor selects the type. """
+    try:
+        config = signing.loads(request.GET.get('config', ''), salt='linkit.panel')
+    except signing.BadSignature:
+        raise Http404
+
+    identifier = request.GET.get('type')
+    name = request.GET.get('name', '')
+    if identifier not in config['types'] or identifier not in type_manager or not re.match(r'^[\w-]+$', name):
+        raise Http404
+
+    return HttpResponse(empty_panel(config, identifier, name))
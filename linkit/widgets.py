@@ -1,12 +1,59 @@
+import json
 from typing import Optional
+from urllib.parse import urlencode
 
-from cms.utils.urlutils import static_with_version
-from django.forms import Widget, CharField, BooleanField, ChoiceField
+from django.conf import settings
+from django.core import signing
+from django.forms import Widget, CharField, BooleanField, ChoiceField, Media
 from django.forms.renderers import DjangoTemplates
+from django.http import QueryDict
+from django.urls import reverse
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
 
+from linkit.instrumentation import instrument
 from linkit.link import Link
+from linkit.scope import scoped_cache
+from linkit.types.autocomplete import AUTOCOMPLETE_MEDIA, autocomplete_enabled
 from linkit.types.manager import type_manager
 
+# Rendered in place of the field name in the cached panel markup
+NAME_PLACEHOLDER = '__linkit_name__'
+
+
+def lazy_panels_enabled() -> bool:
+    """ Only render the panel of the selected type and load the others on demand. Requires linkit.urls. """
+    return getattr(settings, 'LINKIT_LAZY_PANELS', False)
+
+
+def empty_panel(config: dict, identifier: str, name: str) -> str:
+    """
+    Markup of the type form without a value. It only depends on the config and the type, so it's rendered once per
+    request and shared by all widgets with the same config (e.g. in an inline formset).
+    """
+    cache = scoped_cache('linkit_panels')
+    key = (json.dumps(config, sort_keys=True), identifier, get_language())
+    markup = cache.get(key) if cache is not None else None
+    if markup is None:
+        markup = type_manager.instance(identifier, Link(config=config, name=NAME_PLACEHOLDER)).render()
+        if cache is not None:
+            cache[key] = markup
+
+    return mark_safe(markup.replace(NAME_PLACEHOLDER, name))
+
+
+def type_choices(types: list) -> list:
+    """ Cached type_manager.type_choices for the current request. """
+    cache = scoped_cache('linkit_type_choices')
+    if cache is None:
+        return type_manager.type_choices(types)
+
+    key = (tuple(types), get_language())
+    if key not in cache:
+        cache[key] = type_manager.type_choices(types)
+
+    return cache[key]
+
 
 class LinkWidget(Widget):
     template_name = 'django/forms/widgets/link.html'
@@ -15,11 +62,25 @@ class LinkWidget(Widget):
         self.config = config
         super().__init__(attrs)
 
+    @staticmethod
+    def prefixed_data(data, name: str):
+        """ Only the submitted data of our field, so the type forms don't need to look at the whole POST. """
+        prefix = f'{name}_link_'
+        if not hasattr(data, 'lists'):
+            return {key: value for key, value in data.items() if key.startswith(prefix)}
+
+        prefixed = QueryDict(mutable=True)
+        for key, values in data.lists():
+            if key.startswith(prefix):
+                prefixed.setlist(key, values)
+
+        return prefixed
+
     def value_from_datadict(self, data, files, name) -> Link:
         """
-        Get the selected type and initialise a Link object with all the data that got submitted in the POST.
-        For now we'll just assign all the submitted data to the links value property and basically just
-        use it as a DTO. In the LinkFormField's clean method this data will be validated and cleaned.
+        Get the selected type and initialise a Link object with the data of this field that got submitted in the
+        POST. For now we'll just assign it to the links value property and basically just use it as a DTO. In the
+        LinkFormField's clean method this data will be validated and cleaned.
         """
         link_type = type_manager.get(data.get(f'{name}_link_type', None))
         link_data = {
@@ -27,23 +88,30 @@ class LinkWidget(Widget):
             'target': '_blank' if data.get('{}_link_target'.format(name), None) else None,
             'label': data.get('{}_link_label'.format(name), None),
             'no_follow': True if data.get('{}_link_no_follow'.format(name), None) else False,
-            'value': data
+            'value': self.prefixed_data(data, name),
         }
 
         return Link(config=self.config, data=link_data, name=name)
 
     @staticmethod
     def type_fields(link: Link) -> dict:
-        """ Generate all fields for the different link types that are allowed in this link instance. """
+        """
+        Generate all fields for the different link types that are allowed in this link instance. Only the selected
+        type gets rendered with the value of the link, the others are empty or, if lazy panels are enabled, loaded
+        once the editor selects them (markup is None).
+        """
         types = {}
         for link_type in link.config('types'):
             instance = type_manager.instance(link_type, link)
-            try:
-                markup = instance.render()
-            except Exception:
-                # Reset link value if target is no longer available
-                instance.link._data['value'] = {}
-                markup = instance.render()
+            if link_type != link.data('type'):
+                markup = None if lazy_panels_enabled() else empty_panel(link.config(), link_type, link.name)
+            else:
+                try:
+                    markup = instance.render()
+                except Exception:
+                    # Reset link value if target is no longer available
+                    instance.link.set_data('value', {})
+                    markup = instance.render()
             types[link_type] = {
                 'markup': markup,
                 'instance': instance,
@@ -51,13 +119,24 @@ class LinkWidget(Widget):
 
         return types
 
+    @staticmethod
+    def panel_url(link: Link) -> Optional[str]:
+        """ Url of the view rendering the empty panels of the other types, the config is passed signed. """
+        if not lazy_panels_enabled():
+            return None
+
+        return '{}?{}'.format(reverse('linkit:panel'), urlencode({
+            'config': signing.dumps(link.config(), salt='linkit.panel'),
+            'name': link.name,
+        }))
+
     @staticmethod
     def other_fields(link: Link, field_name: str) -> dict:
         """ All fields (except the type fields) that need to get rendered in the template. """
         label = CharField()
         target = BooleanField()
         no_follow = BooleanField()
-        link_type = ChoiceField(choices=type_manager.type_choices(link.config('types')))
+        link_type = ChoiceField(choices=type_choices(link.config('types')))
 
         fields = {
             'label': label.widget.render(
@@ -90,6 +169,7 @@ class LinkWidget(Widget):
                 'name': name,
                 'link': value,
                 'type_fields': self.type_fields(value),
+                'panel_url': self.panel_url(value),
                 'other_fields': self.other_fields(value, name),
                 'allow_target': value.config('allow_target'),
                 'allow_label': value.config('allow_label'),
@@ -104,8 +184,21 @@ class LinkWidget(Widget):
         if not value:
             value = Link(config=self.config, name=name)
 
-        context = self.get_context(name, value, attrs)
-        return self._render(self.template_name, context, renderer)
+        with instrument('widget', value.data('type')):
+            context = self.get_context(name, value, attrs)
+            return self._render(self.template_name, context, renderer)
+
+    @property
+    def media(self):
+        """ The type forms are rendered as markup, so we need to include the media of their widgets ourselves. """
+        from cms.utils.urlutils import static_with_version
+
+        media = Media(js=[static_with_version('cms/js/dist/bundle.forms.pageselectwidget.min.js')])
+        media += Media(media=self.Media)
+        if autocomplete_enabled():
+            media = AUTOCOMPLETE_MEDIA + media
+
+        return media
 
     class Media(object):
         """
@@ -122,7 +215,6 @@ class LinkWidget(Widget):
             ]
         }
         js = (
-            static_with_version('cms/js/dist/bundle.forms.pageselectwidget.min.js'),
             'filer/js/libs/dropzone.min.js',
             'filer/js/addons/dropzone.init.js',
             'filer/js/addons/popup_handling.js',
@@ -17,10 +17,15 @@ DESCRIPTION = 'Painless link handling - be it a custom model, file or cms page'
 URL = 'https://github.com/dreipol/linkit'
 EMAIL = 'dev@dreipol.ch'
 AUTHOR = 'dreipol'
-REQUIRES_PYTHON = '>=3.6.0'
+REQUIRES_PYTHON = '>=3.8.0'
 VERSION = None
 
-REQUIRED = []
+# Keep in sync with requirements.txt, which adds the test requirements
+REQUIRED = [
+    'Django>=4.2,<5.0',
+    'django-cms>=3.11,<4.0',
+    'django-filer>=3.0,<4.0',
+]
 
 here = os.path.abspath(os.path.dirname(__file__))
 
@@ -86,17 +91,23 @@ setup(
     author_email=EMAIL,
     python_requires=REQUIRES_PYTHON,
     url=URL,
-    packages=find_packages(exclude=('tests',)),
+    packages=find_packages(exclude=('tests', 'tests.*', 'benchmarks', 'benchmarks.*')),
     install_requires=REQUIRED,
     include_package_data=True,
     license='MIT',
     classifiers=[
         # Trove classifiers
         # Full list: https://pypi.python.org/pypi?%3Aaction=list_classifiers
+        'Framework :: Django',
+        'Framework :: Django :: 4.2',
         'License :: OSI Approved :: MIT License',
         'Programming Language :: Python',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
         'Programming Language :: Python :: Implementation :: CPython',
         'Programming Language :: Python :: Implementation :: PyPy'
     ],
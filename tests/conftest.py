@@ -0,0 +1,30 @@
+import pytest
+from cms.api import create_page
+from django.contrib.auth import get_user_model
+from django.db import connection
+
+from tests.testapp.models import News
+
+
+@pytest.fixture
+def news(db):
+    return News.objects.create(title='Contact')
+
+
+@pytest.fixture
+def other_news(db):
+    return News.objects.create(title='Imprint')
+
+
+@pytest.fixture
+def page(db):
+    user = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'admin')
+    return create_page('Home', 'test.html', 'en', created_by=user)
+
+
+def store_raw(instance, field_name: str, raw):
+    """ Write the column directly, bypassing LinkField.get_prep_value. """
+    field = instance._meta.get_field(field_name)
+    with connection.cursor() as cursor:
+        cursor.execute('UPDATE {} SET {} = %s WHERE id = %s'.format(instance._meta.db_table, field.column),
+                       [raw, instance.pk])
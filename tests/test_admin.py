@@ -0,0 +1,48 @@
+import pytest
+from django.contrib import admin
+from django.db.models import QuerySet
+from django.test import RequestFactory
+
+from linkit.admin import LinkAdminMixin
+from linkit.link import Link
+from tests.testapp.models import Teaser
+
+pytestmark = pytest.mark.django_db
+
+
+class TeaserAdmin(LinkAdminMixin, admin.ModelAdmin):
+    list_display = ('title',)
+    list_editable = ('title',)
+    link_columns = ('link.label',)
+    link_filters = ('link',)
+
+
+@pytest.fixture
+def changelist(admin_user):
+    def get(**params):
+        request = RequestFactory().get('/', params)
+        request.user = admin_user
+        return TeaserAdmin(Teaser, admin.site).get_changelist_instance(request)
+
+    return get
+
+
+def test_changelist_resolves_the_links_of_the_page(news, changelist, django_assert_num_queries):
+    Teaser.objects.create(title='Set', link=Link.build(type='news', target=news))
+    Teaser.objects.create(title='Empty')
+
+    result = changelist()
+
+    assert isinstance(result.result_list, QuerySet)
+    assert result.result_list.ordered
+    with django_assert_num_queries(0):
+        labels = [str(teaser.link.resolve().label) for teaser in result.result_list if teaser.link.set]
+    assert labels == ['Contact']
+
+
+def test_link_set_filter(news, changelist):
+    Teaser.objects.create(title='Set', link=Link.build(type='news', target=news))
+    Teaser.objects.create(title='Empty')
+
+    assert [teaser.title for teaser in changelist(link_set='yes').result_list] == ['Set']
+    assert [teaser.title for teaser in changelist(link_set='no').result_list] == ['Empty']
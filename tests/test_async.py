@@ -0,0 +1,52 @@
+import pytest
+from asgiref.sync import async_to_sync
+
+from linkit.link import Link
+from linkit.querysets import aresolve_links
+from linkit.scope import request_scope
+from tests.testapp.link_types import NewsLinkType
+
+pytestmark = pytest.mark.django_db
+
+
+def test_aresolve_links(news, other_news, django_assert_num_queries):
+    links = [Link.build(type='news', target=target) for target in [news, other_news, news]]
+    links.append(Link.build(type='input', target='https://example.com'))
+    links.append(Link(config={}))
+
+    with django_assert_num_queries(1):
+        resolved = async_to_sync(aresolve_links)(links)
+
+    assert [link.href for link in resolved] == [news.get_absolute_url(), other_news.get_absolute_url(),
+                                                news.get_absolute_url(), 'https://example.com', None]
+    assert resolved[:4] == [link.resolve() for link in links[:4]]
+
+
+def test_async_safe(news, monkeypatch):
+    assert Link.build(type='input', target='https://example.com').async_safe
+    assert Link(config={}).async_safe
+    assert not Link.build(type='news', target=news).async_safe
+
+    monkeypatch.setattr(NewsLinkType, 'async_safe', True)
+    link = Link.build(type='news', target=news)
+    assert not link.async_safe
+    async_to_sync(aresolve_links)([link])
+    assert link.async_safe
+
+
+def test_link_coroutines(news, django_assert_num_queries):
+    link = Link.build(type='news', target=news)
+
+    with django_assert_num_queries(1):
+        assert async_to_sync(link.ahref)() == news.get_absolute_url()
+        assert async_to_sync(link.alabel)() == 'Contact'
+        assert async_to_sync(link.aresolve)() == link.resolve()
+
+
+def test_areal_value_uses_the_identity_map(news, django_assert_num_queries):
+    links = [Link.build(type='news', target=news) for i in range(3)]
+
+    with request_scope(), django_assert_num_queries(1):
+        values = [async_to_sync(link.link_type.areal_value)() for link in links]
+
+    assert values == [news] * 3
@@ -0,0 +1,47 @@
+import threading
+
+from django.utils import translation
+
+from linkit.cache import MISSING, ResolutionCache
+
+
+def test_key_without_active_language(settings):
+    settings.LANGUAGE_CODE = 'de'
+    cache = ResolutionCache()
+
+    with translation.override(None):
+        assert cache.key('news', 1) == 'linkit:news:1:de'
+
+
+def test_invalidate_entries_stored_without_active_language(settings):
+    settings.LINKIT_CACHE = {'BACKEND': None}
+    settings.LANGUAGE_CODE = 'fr'
+    cache = ResolutionCache()
+    with translation.override(None):
+        cache.set('news', 1, 'value')
+
+    cache.invalidate('news', [1])
+
+    with translation.override(None):
+        assert cache.get('news', 1) is MISSING
+
+
+def test_counters_are_thread_safe(settings):
+    settings.LINKIT_CACHE = {'BACKEND': 'default', 'LOCAL_TIMEOUT': 0}
+    cache = ResolutionCache()
+    cache.shared.set(cache.key('news', 1), 'value')
+
+    def read():
+        for index in range(500):
+            cache.get('news', 1)
+            cache.get('news', 2)
+
+    threads = [threading.Thread(target=read) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert stats['local_hits'] + stats['shared_hits'] == 2000
+    assert stats['misses'] == 2000
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from linkit.link import Link
+from tests.conftest import store_raw
+from tests.testapp.models import News, Teaser
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def teasers(news):
+    missing = News.objects.create(title='Gone')
+    teasers = [Teaser.objects.create(link=Link.build(type='news', target=target)) for target in [news, missing]]
+    missing.delete()
+
+    unregistered = Teaser.objects.create(link=Link.build(type='news', target=news))
+    store_raw(unregistered, 'link', json.dumps({'type': 'removed', 'value': {'pk': 1}}))
+    return teasers + [unregistered]
+
+
+def run(*args, **options):
+    options.setdefault('workers', 1)
+    options.setdefault('model', 'testapp.Teaser')
+    call_command('linkit_check', *args, **options)
+
+
+def test_text_report(teasers, capsys):
+    run()
+
+    lines = capsys.readouterr().out.splitlines()
+    assert sorted(lines) == [
+        'testapp.Teaser {} link: news {} does not exist'.format(teasers[1].pk, teasers[1].link.link_type.pk),
+        'testapp.Teaser {} link: link type removed is not registered'.format(teasers[2].pk),
+    ]
+
+
+def test_json_output_file(teasers, tmp_path):
+    output = tmp_path / 'report.json'
+    run(format='json', output=str(output))
+
+    report = json.loads(output.read_text())
+    assert sorted((row['pk'], row['reason']) for row in report) == [(str(teasers[1].pk), 'missing'),
+                                                                     (str(teasers[2].pk), 'unregistered')]
+
+
+def test_csv_report(teasers, capsys):
+    run(format='csv')
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == 'model,pk,field,link_type,target_pk,reason'
+    assert len(lines) == 3
+
+
+def test_model_option(teasers, capsys):
+    run(model='testapp.NativeTeaser')
+    assert capsys.readouterr().out == ''
+
+    with pytest.raises(CommandError):
+        run(model='testapp.News')
@@ -0,0 +1,37 @@
+import copy
+import pickle
+
+import pytest
+
+from linkit.link import Link
+from linkit.querysets import prefetch_links
+from linkit.types.contracts import UNRESOLVED
+from tests.testapp.models import Teaser
+
+pytestmark = pytest.mark.django_db
+
+
+def copies(instance):
+    return [copy.copy(instance), copy.deepcopy(instance), pickle.loads(pickle.dumps(instance))]
+
+
+def test_sentinel_survives_copies():
+    assert all(value is UNRESOLVED for value in copies(UNRESOLVED))
+
+
+def test_unresolved_links_can_be_copied(news):
+    Teaser.objects.create(link=Link.build(type='news', target=news))
+    teaser = Teaser.objects.get()
+
+    for copied in copies(teaser):
+        assert copied.link.attached is UNRESOLVED
+        assert copied.link.href == news.get_absolute_url()
+
+
+def test_resolved_links_can_be_copied(news, django_assert_num_queries):
+    Teaser.objects.create(link=Link.build(type='news', target=news))
+    teaser = prefetch_links(Teaser.objects.all(), 'link')[0]
+
+    for copied in copies(teaser):
+        with django_assert_num_queries(0):
+            assert copied.link.href == news.get_absolute_url()
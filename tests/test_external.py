@@ -0,0 +1,90 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from linkit.external import ExternalLinkChecker, check_external_links
+from linkit.link import Link
+from linkit.models import ExternalLinkCheck
+from tests.testapp.models import Teaser
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_HEAD(self):
+        if self.path.startswith('/head-not-allowed'):
+            self.respond(405)
+        elif self.path.startswith('/early-hints'):
+            self.send_response_only(103)
+            self.send_header('Link', '</style.css>; rel=preload')
+            self.end_headers()
+            self.respond(200)
+        else:
+            self.respond(404 if self.path.startswith('/missing') else 200)
+
+    def do_GET(self):
+        self.respond(200)
+
+    def respond(self, status: int):
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield 'http://127.0.0.1:{}'.format(server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
+def check(urls: list):
+    return asyncio.run(ExternalLinkChecker(concurrency=5, rate=None, timeout=2).run(urls))
+
+
+def test_check(server):
+    report = check([server + '/page/{}'.format(index) for index in range(20)] + [server + '/missing'])
+
+    assert len(report.results) == 21
+    assert [(result.url, result.status) for result in report.broken] == [(server + '/missing', 404)]
+    assert report.host_latency()['127.0.0.1']['requests'] == 21
+
+
+def test_get_if_head_is_not_allowed(server):
+    assert check([server + '/head-not-allowed?q=ä']).results[0].status == 200
+
+
+def test_interim_responses_are_skipped(server):
+    report = check([server + '/early-hints', server + '/early-hints?again'])
+
+    assert [result.status for result in report.results] == [200, 200]
+
+
+def test_failed_requests():
+    report = check(['http://127.0.0.1:1/closed', 'http:///no-host'])
+
+    assert [result.status for result in report.results] == [None, None]
+    assert all(result.error for result in report.results)
+
+
+@pytest.mark.django_db
+def test_check_external_links(server):
+    for path in ['/first', '/second', '/missing', '/first']:
+        Teaser.objects.create(link=Link.build(type='input', target=server + path))
+
+    report = check_external_links(checker=ExternalLinkChecker(rate=None, timeout=2), chunk_size=2)
+
+    assert sorted(result.url for result in report.results) == [server + path
+                                                             for path in ['/first', '/missing', '/second']]
+    assert set(ExternalLinkCheck.objects.values_list('url', 'ok')) == {
+        (server + '/first', True), (server + '/second', True), (server + '/missing', False),
+    }
+    assert check_external_links().results == []
@@ -0,0 +1,27 @@
+import pytest
+from django.core.files.base import ContentFile
+from filer.models import File
+
+from linkit.types.file import file_url_cache, file_urls
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def file(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    file = File.objects.create(file=ContentFile(b'linkit', name='linkit.txt'), original_filename='linkit.txt')
+    yield file
+    file.file.delete(save=False)
+
+
+def test_file_urls_are_cached(file, settings, django_assert_num_queries):
+    settings.LINKIT_FILE_URL_CACHE = {'BACKEND': None}
+    file_url_cache.clear()
+
+    with django_assert_num_queries(1):
+        assert file_urls([file.pk, 999]) == {str(file.pk): file.url}
+    with django_assert_num_queries(0):
+        assert file_urls([file.pk, 999]) == {str(file.pk): file.url}
+
+    file_url_cache.clear()
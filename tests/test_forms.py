@@ -0,0 +1,83 @@
+import pytest
+from django import forms
+
+from linkit.models import LinkReference
+from tests.testapp.models import Teaser
+
+pytestmark = pytest.mark.django_db
+
+
+class TeaserForm(forms.ModelForm):
+    class Meta:
+        model = Teaser
+        fields = ['title', 'link']
+
+
+def post_data(**data):
+    return {'title': 'Teaser', 'link_link_label': '', **data}
+
+
+def test_save_model_link(news):
+    form = TeaserForm(data=post_data(link_link_type='news', **{'link_link_news-model': str(news.pk)}))
+    assert form.is_valid(), form.errors
+
+    teaser = Teaser.objects.get(pk=form.save().pk)
+    assert teaser.link.data('type') == 'news'
+    assert teaser.link.href == news.get_absolute_url()
+
+
+def test_save_input_link():
+    form = TeaserForm(data=post_data(link_link_type='input', **{'link_link_input-input': 'https://example.com'}))
+    assert form.is_valid(), form.errors
+
+    teaser = Teaser.objects.get(pk=form.save().pk)
+    assert teaser.link.href == 'https://example.com'
+    assert teaser.link.target == '_self'
+
+
+def test_invalid_target():
+    form = TeaserForm(data=post_data(link_link_type='news', **{'link_link_news-model': '999'}))
+
+    assert not form.is_valid()
+    assert 'link' in form.errors
+
+
+def test_save_stores_the_target_pk_in_the_references(news, settings):
+    settings.LINKIT_REFERENCES = True
+    form = TeaserForm(data=post_data(link_link_type='news', **{'link_link_news-model': str(news.pk)}))
+    assert form.is_valid(), form.errors
+    teaser = form.save()
+
+    reference = LinkReference.objects.get()
+    assert reference.source == teaser
+    assert (reference.link_type, reference.target_pk) == ('news', str(news.pk))
+    assert teaser.link.link_type.pk == news.pk
+
+
+def submitted_link(**data):
+    form = TeaserForm(data=post_data(**data))
+    return form.fields['link'].widget.value_from_datadict(form.data, form.files, 'link')
+
+
+def test_submitted_pk(news, page):
+    link = submitted_link(link_link_type='news', **{'link_link_news-model': str(news.pk)})
+    assert link.link_type.submitted_pk() == str(news.pk)
+
+    link = submitted_link(link_link_type='page', **{'link_link_page-page_0': '1',
+                                                     'link_link_page-page_1': str(page.pk)})
+    assert link.link_type.submitted_pk() == str(page.pk)
+
+
+def test_submitted_pk_of_the_page_autocomplete(page, settings):
+    settings.LINKIT_AUTOCOMPLETE = True
+    link = submitted_link(link_link_type='page', **{'link_link_page-page': str(page.pk)})
+
+    assert link.link_type.submitted_pk() == str(page.pk)
+
+
+def test_save_page_link(page):
+    form = TeaserForm(data=post_data(link_link_type='page', **{'link_link_page-page_0': '1',
+                                                               'link_link_page-page_1': str(page.pk)}))
+    assert form.is_valid(), form.errors
+
+    assert Teaser.objects.get(pk=form.save().pk).link.data('value') == {'page': page.pk}
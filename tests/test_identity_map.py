@@ -0,0 +1,52 @@
+import pytest
+
+from linkit.link import Link
+from linkit.querysets import resolve_links
+from linkit.scope import identity_map, request_scope
+
+pytestmark = pytest.mark.django_db
+
+
+def links(target, count=3):
+    return [Link.build(type='news', target=target) for i in range(count)]
+
+
+def test_targets_are_loaded_once_per_scope(news, django_assert_num_queries):
+    with request_scope():
+        with django_assert_num_queries(1):
+            assert {link.label for link in links(news)} == {'Contact'}
+            resolve_links(links(news))
+
+        assert identity_map() == {('news', str(news.pk)): news}
+
+
+def test_resolve_links_fills_the_identity_map(news, other_news, django_assert_num_queries):
+    with request_scope():
+        with django_assert_num_queries(1):
+            resolve_links(links(news) + links(other_news))
+            assert [link.href for link in links(other_news)] == [other_news.get_absolute_url()] * 3
+
+
+def test_missing_targets_are_shared(django_assert_num_queries):
+    with request_scope(), django_assert_num_queries(1):
+        assert [link.href for link in links(999)] == [False] * 3
+
+
+def test_without_scope(news, django_assert_num_queries):
+    with django_assert_num_queries(3):
+        assert [link.label for link in links(news)] == ['Contact'] * 3
+
+
+def test_disabled(news, settings, django_assert_num_queries):
+    settings.LINKIT_IDENTITY_MAP = False
+    with request_scope(), django_assert_num_queries(3):
+        assert [link.label for link in links(news)] == ['Contact'] * 3
+
+
+def test_saved_targets_are_reloaded(news):
+    with request_scope():
+        assert links(news, 1)[0].label == 'Contact'
+        news.title = 'Contact us'
+        news.save()
+
+        assert links(news, 1)[0].label == 'Contact us'
@@ -0,0 +1,19 @@
+from benchmarks.importtime import FORBIDDEN, MODULE, importtime
+from linkit.types import FileType, InputType, PageType
+from linkit.types.manager import type_manager
+
+# Milliseconds for the linkit modules, see benchmarks/importtime.py
+BUDGET = 30
+
+
+def test_model_field_import():
+    modules = importtime(MODULE)
+
+    assert not [name for name in modules if name.split('.')[0] in FORBIDDEN or name in FORBIDDEN]
+    assert sum(times['self'] for name, times in modules.items() if name.split('.')[0] == 'linkit') / 1000 < BUDGET
+
+
+def test_lazy_type_imports():
+    assert PageType is type_manager.get('page')
+    assert FileType is type_manager.get('file')
+    assert InputType is type_manager.get('input')
@@ -0,0 +1,83 @@
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from linkit.instrumentation import Resolution, link_resolved, record, track_links
+from linkit.link import Link
+from linkit.middleware import LinkitMiddleware
+from linkit.querysets import prefetch_links
+from linkit.types.model import ModelLinkType
+from linkit.types.manager import type_manager
+from tests.testapp.models import News, Teaser
+
+pytestmark = pytest.mark.django_db
+
+
+class UnmemoizedNewsType(ModelLinkType):
+    """ Loads its target on every access, without LinkType.memoized. """
+    identifier = 'unmemoized'
+    model = News
+
+    def real_value(self):
+        return News.objects.filter(pk=self.pk).first()
+
+
+def test_lookups_are_recorded(news, other_news):
+    for target in [news, other_news]:
+        Teaser.objects.create(link=Link.build(type='news', target=target))
+
+    with track_links() as stats:
+        for teaser in Teaser.objects.all():
+            teaser.link.href
+
+    assert len(stats.lookups) == 2
+
+
+def test_prefetched_targets_are_no_lookups(news, other_news):
+    for target in [news, other_news]:
+        Teaser.objects.create(link=Link.build(type='news', target=target))
+
+    with track_links() as stats:
+        for teaser in prefetch_links(Teaser.objects.all(), 'link'):
+            teaser.link.href
+
+    assert stats.lookups == []
+    assert stats.summary()['cache'] == {'hit': 2}
+
+
+def test_lookups_of_custom_types_are_recorded(news, monkeypatch):
+    monkeypatch.setitem(type_manager._types, 'unmemoized', UnmemoizedNewsType)
+    link = Link.build(type='unmemoized', target=news)
+
+    with track_links() as stats:
+        assert link.href == news.get_absolute_url()
+
+    assert [(record.identifier, record.pk) for record in stats.lookups] == [('unmemoized', str(news.pk))]
+
+
+@pytest.mark.parametrize('debug, budget, tracked', [(False, None, False), (True, None, True), (False, 10, True)])
+def test_middleware_only_tracks_if_enabled(settings, debug, budget, tracked):
+    settings.DEBUG = debug
+    settings.LINKIT_RESOLUTION_BUDGET = budget
+    request = RequestFactory().get('/')
+
+    LinkitMiddleware(lambda request: HttpResponse())(request)
+
+    assert hasattr(request, 'linkit_stats') == tracked
+
+
+def test_record():
+    received = []
+
+    def receiver(sender, record, **kwargs):
+        received.append(record)
+
+    record('href', 'news', 1, cache='hit')
+    link_resolved.connect(receiver)
+    try:
+        with track_links() as stats:
+            record('href', 'news', 1, cache='hit')
+    finally:
+        link_resolved.disconnect(receiver)
+
+    assert stats.records == received == [Resolution('href', 'news', '1', 0.0, 'hit')]
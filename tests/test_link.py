@@ -0,0 +1,74 @@
+import copy
+
+import pytest
+
+from linkit.link import Link
+from linkit.utils import changed_link_fields, skip_unchanged_links
+from tests.conftest import store_raw
+from tests.testapp.models import Teaser
+
+pytestmark = pytest.mark.django_db
+
+
+def test_build(news):
+    link = Link.build(type='news', target=news, label='Contact us', new_tab=True)
+
+    assert link.data('value') == {'model': news.pk}
+    assert link.label == 'Contact us'
+    assert link.target == '_blank'
+    assert link.href == news.get_absolute_url()
+    assert link.changed
+
+
+def test_unchanged_link_is_stored_as_loaded(news):
+    teaser = Teaser.objects.create(link=Link.build(type='news', target=news))
+    raw = '{"type":"news",  "value": {"model": %d}, "label": null, "target": null, "no_follow": false}' % news.pk
+    store_raw(teaser, 'link', raw)
+
+    teaser = Teaser.objects.get(pk=teaser.pk)
+    assert not teaser.link.changed
+    assert teaser.link.href == news.get_absolute_url()
+    assert Teaser._meta.get_field('link').get_prep_value(teaser.link) == raw
+    assert changed_link_fields(teaser) == []
+    assert skip_unchanged_links(teaser) == ['title']
+
+
+def test_changed_link_is_serialized(news, other_news):
+    teaser = Teaser.objects.create(link=Link.build(type='news', target=news))
+    teaser = Teaser.objects.get(pk=teaser.pk)
+
+    teaser.link.set_data('value', {'model': other_news.pk})
+    assert teaser.link.changed
+    assert changed_link_fields(teaser) == ['link']
+    assert skip_unchanged_links(teaser) == ['title', 'link']
+
+    teaser.save(update_fields=skip_unchanged_links(teaser))
+    assert Teaser.objects.get(pk=teaser.pk).link.href == other_news.get_absolute_url()
+
+
+@pytest.mark.parametrize('write', [
+    lambda data, value: data.__setitem__('value', value),
+    lambda data, value: data.update(value=value),
+    lambda data, value: (data.pop('value'), data.setdefault('value', value)),
+])
+def test_direct_writes_are_stored(news, other_news, write):
+    Teaser.objects.create(link=Link.build(type='news', target=news))
+    teaser = Teaser.objects.get()
+    assert teaser.link.href == news.get_absolute_url()
+
+    write(teaser.link.data(), {'model': other_news.pk})
+
+    assert teaser.link.changed
+    assert teaser.link.href == other_news.get_absolute_url()
+    teaser.save()
+    assert Teaser.objects.get().link.href == other_news.get_absolute_url()
+
+
+def test_copied_links_are_tracked(news, other_news):
+    Teaser.objects.create(link=Link.build(type='news', target=news))
+    teaser = copy.deepcopy(Teaser.objects.get())
+
+    teaser.link.data()['value'] = {'model': other_news.pk}
+
+    assert teaser.link.changed
+    assert teaser.link.href == other_news.get_absolute_url()
@@ -0,0 +1,71 @@
+import pytest
+
+from linkit.link import Link
+from linkit.lookups import LinkTargetTransform
+from linkit.types.contracts import LinkType
+from linkit.types.manager import type_manager
+from tests.conftest import store_raw
+from tests.testapp.models import NativeTeaser, Teaser
+
+pytestmark = pytest.mark.django_db
+
+
+class OtherType(LinkType):
+    identifier = 'other'
+    value_key = 'other'
+
+
+@pytest.fixture(params=[Teaser, NativeTeaser])
+def model(request):
+    return request.param
+
+
+def test_type_and_target_pk(model, news, other_news):
+    first = model.objects.create(link=Link.build(type='news', target=news))
+    model.objects.create(link=Link.build(type='news', target=other_news))
+    model.objects.create(link=Link.build(type='input', target='https://example.com'))
+
+    assert model.objects.filter(link__type='news').count() == 2
+    assert model.objects.filter(link__type='input').count() == 1
+    assert list(model.objects.filter(link__type='news', link__target_pk=str(news.pk))) == [first]
+
+
+def test_isset(model, news):
+    linked = model.objects.create(link=Link.build(type='news', target=news))
+    model.objects.create(link=None)
+    model.objects.create(link=Link(config={}, data={'type': 'news', 'value': {'model': ''}}))
+
+    assert list(model.objects.filter(link__isset=True)) == [linked]
+    assert model.objects.filter(link__isset=False).count() == 2
+
+
+def test_empty_string_is_not_set():
+    store_raw(Teaser.objects.create(link=None), 'link', '')
+
+    assert Teaser.objects.filter(link__type='news').count() == 0
+    assert Teaser.objects.filter(link__isset=False).count() == 1
+
+
+def test_malformed_json_is_skipped(news):
+    linked = Teaser.objects.create(link=Link.build(type='news', target=news))
+    store_raw(Teaser.objects.create(link=None), 'link', '{"type": "news", "value": ')
+
+    assert list(Teaser.objects.filter(link__type='news')) == [linked]
+    assert list(Teaser.objects.filter(link__target_pk=str(news.pk))) == [linked]
+    assert list(Teaser.objects.filter(link__isset=True)) == [linked]
+
+
+def test_target_pk_of_an_explicit_type(model, news):
+    linked = model.objects.create(link=Link.build(type='news', target=news))
+    target = LinkTargetTransform('link', link_type='news')
+
+    assert list(model.objects.annotate(target=target).filter(target=str(news.pk))) == [linked]
+    assert not model.objects.annotate(target=LinkTargetTransform('link', link_type='page')).filter(
+        target=str(news.pk)).exists()
+
+
+def test_target_pk_only_depends_on_the_field_types(monkeypatch):
+    query = str(Teaser.objects.filter(link__target_pk='1').query)
+    monkeypatch.setitem(type_manager._types, 'other', OtherType)
+
+    assert str(Teaser.objects.filter(link__target_pk='1').query) == query
@@ -0,0 +1,51 @@
+import pytest
+
+from linkit.link import Link
+from tests.testapp.models import Teaser
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def teaser(news):
+    Teaser.objects.create(link=Link.build(type='news', target=news))
+    return Teaser.objects.get()
+
+
+def test_target_is_loaded_once(teaser, news, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        for attempt in range(3):
+            assert teaser.link.href == news.get_absolute_url()
+            assert teaser.link.label == 'Contact'
+            assert teaser.link.value == news
+
+
+@pytest.mark.parametrize('change', [
+    lambda link, pk: link.set_data('value', {'model': pk}),
+    lambda link, pk: link.data().__setitem__('value', {'model': pk}),
+    lambda link, pk: link.data('value').__setitem__('model', pk),
+    lambda link, pk: link.data('value').update(model=pk),
+])
+def test_memoized_target_is_reset_on_change(teaser, news, other_news, change, django_assert_num_queries):
+    assert teaser.link.href == news.get_absolute_url()
+
+    change(teaser.link, other_news.pk)
+
+    with django_assert_num_queries(1):
+        assert teaser.link.href == other_news.get_absolute_url()
+        assert teaser.link.label == 'Imprint'
+
+
+def test_nested_writes_mark_the_link_as_changed(teaser, other_news):
+    teaser.link.data('value')['model'] = other_news.pk
+    teaser.save()
+
+    assert Teaser.objects.get().link.href == other_news.get_absolute_url()
+
+
+def test_plain_data_is_untracked(teaser):
+    data = teaser.link.to_dict(resolve=False)
+    data['value']['model'] = None
+
+    assert not teaser.link.changed
+    assert type(data['value']) is dict
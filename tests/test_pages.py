@@ -0,0 +1,56 @@
+import pytest
+from cms.api import create_page, create_title
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils.translation import override
+
+from linkit.link import Link
+from linkit.querysets import resolve_links
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def pages(page):
+    pages = [create_page('Page {}'.format(i), 'test.html', 'en', parent=page, created_by=page.created_by)
+             for i in range(6)]
+    create_title('de', 'Seite 0', pages[0])
+    return pages
+
+
+def resolve(pages) -> tuple:
+    """ Resolve links to the pages, returns (query count, hrefs, labels). """
+    links = [Link.build(type='page', target=page) for page in pages]
+    with CaptureQueriesContext(connection) as queries:
+        resolve_links(links)
+        hrefs = [link.href for link in links]
+        labels = [str(link.label) for link in links]
+
+    return len(queries), hrefs, labels
+
+
+def test_constant_number_of_queries(pages):
+    few = resolve(pages[:2])
+    many = resolve(pages)
+
+    # The pages and their titles
+    assert few[0] == many[0] == 2
+    assert many[1] == [page.get_absolute_url() for page in pages]
+    assert many[2] == ['Page {}'.format(i) for i in range(6)]
+
+
+def test_current_language(pages):
+    with override('de'):
+        count, hrefs, labels = resolve(pages[:2])
+
+    assert (hrefs[0], labels[0]) == (pages[0].get_absolute_url(language='de'), 'Seite 0')
+    assert hrefs[0] != pages[0].get_absolute_url(language='en')
+    # Untranslated pages fall back to django CMS
+    assert (hrefs[1], labels[1]) == (pages[1].get_absolute_url(language='de'), pages[1].get_title(language='de'))
+
+
+def test_home_page(page):
+    count, hrefs, labels = resolve([page])
+
+    assert hrefs == [page.get_absolute_url()]
+    assert labels == ['Home']
@@ -0,0 +1,15 @@
+from linkit.receivers import watched_types
+from linkit.types.manager import type_manager
+
+
+def test_types_registered_by_path_are_not_imported(monkeypatch):
+    monkeypatch.setitem(type_manager._types, 'missing', 'tests.testapp.missing.MissingType')
+
+    assert 'missing' not in {link_type.identifier for link_type in type_manager.loaded()}
+    assert 'missing' not in {link_type.identifier for link_type in watched_types()}
+
+
+def test_types_of_snapshot_fields_are_watched(monkeypatch):
+    monkeypatch.setitem(type_manager._types, 'news', 'tests.testapp.link_types.NewsLinkType')
+
+    assert 'news' in {link_type.identifier for link_type in watched_types()}
@@ -0,0 +1,55 @@
+import pytest
+
+from linkit import references
+from linkit.link import Link
+from linkit.models import LinkReference
+from linkit.utils import link_fields
+from tests.testapp.models import ChildTeaser, ProxyTeaser, Teaser
+
+pytestmark = pytest.mark.django_db
+
+
+def test_rebuild(news, other_news):
+    for target in [news, other_news]:
+        Teaser.objects.create(link=Link.build(type='news', target=target))
+    Teaser.objects.create(link=Link.build(type='input', target='https://example.com'))
+
+    count = references.rebuild_references(Teaser, Teaser._meta.get_field('link'), chunk_size=1)
+
+    assert count == 2
+    assert LinkReference.objects.to(news).count() == 1
+
+
+def test_failed_rebuild_keeps_the_references(news, monkeypatch):
+    Teaser.objects.create(link=Link.build(type='news', target=news))
+    references.rebuild_references(Teaser, Teaser._meta.get_field('link'))
+
+    def fail(*args, **kwargs):
+        raise RuntimeError
+
+    monkeypatch.setattr(references, 'link_target', fail)
+    with pytest.raises(RuntimeError):
+        references.rebuild_references(Teaser, Teaser._meta.get_field('link'))
+
+    assert LinkReference.objects.to(news).count() == 1
+
+
+@pytest.mark.parametrize('model', [ProxyTeaser, ChildTeaser])
+def test_references_of_proxy_and_child_models(model, news, other_news, settings):
+    settings.LINKIT_REFERENCES = True
+    teaser = model.objects.create(link=Link.build(type='news', target=news))
+
+    reference = LinkReference.objects.to(news).get()
+    assert reference.source == Teaser.objects.get(pk=teaser.pk)
+
+    teaser.link.set_data('value', {'model': other_news.pk})
+    teaser.save()
+    assert LinkReference.objects.to(other_news).count() == 1
+    assert not LinkReference.objects.to(news).exists()
+
+    teaser.delete()
+    assert not LinkReference.objects.exists()
+
+
+def test_link_fields_are_listed_once():
+    assert [model for model, field in link_fields() if issubclass(model, Teaser)] == [Teaser]
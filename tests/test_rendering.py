@@ -0,0 +1,54 @@
+import pytest
+from django.template import Context, Template
+
+from linkit.link import Link, ResolvedLink
+from tests.testapp.models import Teaser
+
+pytestmark = pytest.mark.django_db
+
+
+def render(template: str, **context) -> str:
+    return Template('{% load linkit_tags %}' + template).render(Context(context))
+
+
+def test_resolve_loads_the_target_once(news, django_assert_num_queries):
+    teaser = Teaser.objects.create(link=Link.build(type='news', target=news, new_tab=True, no_follow=True))
+    teaser = Teaser.objects.get(pk=teaser.pk)
+
+    with django_assert_num_queries(1):
+        resolved = teaser.link.resolve()
+        html = teaser.link.as_html()
+
+    assert resolved == ResolvedLink(news.get_absolute_url(), 'Contact', '_blank', 'nofollow noopener', True)
+    assert html == '<a href="{}" rel="nofollow noopener" target="_blank">Contact</a>'.format(news.get_absolute_url())
+
+
+def test_template_tag(news, django_assert_num_queries):
+    teaser = Teaser.objects.get(pk=Teaser.objects.create(link=Link.build(type='news', target=news)).pk)
+
+    with django_assert_num_queries(1):
+        html = render('{% linkit teaser.link class="button" %}{% linkit teaser.link %}', teaser=teaser)
+
+    anchor = '<a{} href="{}" target="_self">Contact</a>'
+    url = news.get_absolute_url()
+    assert html == anchor.format(' class="button"', url) + anchor.format('', url)
+
+
+def test_template_tag_without_link():
+    assert render('{% linkit link %}', link=None) == ''
+
+
+def test_missing_target(news):
+    link = Link.build(type='news', target=news, label='Contact us')
+    news.delete()
+
+    assert link.resolve().href is None
+    assert link.as_html() == 'Contact us'
+    assert Link.build(type='news', target=999).as_html() == ''
+
+
+def test_unregistered_type():
+    link = Link(config={'allow_label': True}, data={'type': 'removed', 'value': 1, 'label': 'Old <b>'})
+
+    assert link.resolve() == ResolvedLink(None, 'Old <b>', '_self', '', False)
+    assert link.as_html() == 'Old &lt;b&gt;'
@@ -0,0 +1,80 @@
+import pytest
+from django.core.management import CommandError, call_command
+
+from linkit import repoint as repoint_module
+from linkit.link import Link
+from linkit.repoint import repoint
+from tests.testapp.models import Teaser
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def teasers(news, other_news):
+    return [Teaser.objects.create(link=Link.build(type='news', target=target))
+            for target in [news, news, other_news]]
+
+
+def test_dry_run(teasers, news, other_news):
+    counts = repoint('news', news.pk, other_news.pk, dry_run=True)
+
+    assert counts['testapp.Teaser.link'] == 2
+    assert Teaser.objects.filter(link__target_pk=str(news.pk)).count() == 2
+
+
+@pytest.mark.parametrize('in_database', [True, False])
+def test_repoint(teasers, news, other_news, monkeypatch, in_database):
+    if not in_database:
+        monkeypatch.setattr(repoint_module, '_update_sql', lambda vendor, field: None)
+
+    counts = repoint('news', news.pk, other_news.pk, chunk_size=1)
+
+    assert counts['testapp.Teaser.link'] == 2
+    assert Teaser.objects.filter(link__target_pk=str(other_news.pk)).count() == 3
+    assert {teaser.link.href for teaser in Teaser.objects.all()} == {other_news.get_absolute_url()}
+
+
+@pytest.mark.parametrize('in_database', [True, False])
+def test_repoint_plain_values(news, other_news, settings, monkeypatch, in_database):
+    settings.LINKIT_REFERENCES = True
+    if not in_database:
+        monkeypatch.setattr(repoint_module, '_update_sql', lambda vendor, field: None)
+    teaser = Teaser.objects.create(link=Link(config={}, data={'type': 'news', 'value': news.pk}))
+
+    counts = repoint('news', news.pk, other_news.pk)
+
+    assert counts['testapp.Teaser.link'] == 1
+    assert Teaser.objects.get(pk=teaser.pk).link.data('value') == other_news.pk
+
+
+def test_scan_finds_rows_missing_from_references(news, other_news, settings):
+    settings.LINKIT_REFERENCES = True
+    Teaser.objects.bulk_create([Teaser(link=Link.build(type='news', target=news))])
+
+    assert repoint('news', news.pk, other_news.pk, dry_run=True)['testapp.Teaser.link'] == 0
+    assert repoint('news', news.pk, other_news.pk, scan=True)['testapp.Teaser.link'] == 1
+    assert Teaser.objects.get().link.href == other_news.get_absolute_url()
+
+
+def test_postgresql_char_field_sql():
+    sql = repoint_module._update_sql('postgresql', Teaser._meta.get_field('link')).format(column='"link"')
+
+    assert sql.startswith('(CASE WHEN jsonb_typeof(("link")::jsonb -> \'value\')')
+    assert "'{value}'" in sql and sql.endswith('END)::text')
+
+
+def test_missing_target(teasers, news):
+    with pytest.raises(ValueError):
+        repoint('news', news.pk, 999)
+
+
+def test_command(teasers, news, other_news, capsys):
+    call_command('linkit_repoint', type='news', old_pk=str(news.pk), new_pk=str(other_news.pk))
+
+    assert 'testapp.Teaser.link: 2 links repointed' in capsys.readouterr().out
+    assert Teaser.objects.filter(link__target_pk=str(news.pk)).count() == 0
+
+
+def test_command_invalid_pk(teasers, news):
+    with pytest.raises(CommandError):
+        call_command('linkit_repoint', type='news', old_pk=str(news.pk), new_pk='abc')
@@ -0,0 +1,65 @@
+import io
+import json
+
+import pytest
+
+from linkit.link import Link
+from linkit.serializers import iter_json, serialize_links, write_json
+from tests.testapp.models import Teaser
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def teasers(news, other_news):
+    links = [Link.build(type='news', target=news, new_tab=True), Link.build(type='news', target=other_news),
+             Link.build(type='input', target='https://example.com'), None]
+    return [Teaser.objects.create(title=str(i), link=link) for i, link in enumerate(links)]
+
+
+def test_to_dict(news):
+    link = Link.build(type='news', target=news, new_tab=True)
+
+    assert link.to_dict() == {'type': 'news', 'href': news.get_absolute_url(), 'label': 'Contact', 'target': '_blank',
+                              'rel': 'noopener', 'external': True}
+    assert link.to_dict(resolve=False) == {'type': 'news', 'value': {'model': news.pk}, 'label': None,
+                                           'target': '_blank', 'no_follow': False}
+
+
+def test_serialize_instances(teasers, news, django_assert_num_queries):
+    teasers = list(Teaser.objects.order_by('pk'))
+
+    with django_assert_num_queries(1):
+        data = serialize_links(teasers, 'link')
+
+    assert [row['link'] and row['link']['href'] for row in data] == [
+        news.get_absolute_url(), teasers[1].link.href, 'https://example.com', None]
+
+
+def test_serialize_links(teasers, django_assert_num_queries):
+    links = [teaser.link for teaser in Teaser.objects.order_by('pk')]
+
+    with django_assert_num_queries(1):
+        data = serialize_links(links)
+
+    assert [row['label'] if row else None for row in data] == ['Contact', 'Imprint', 'https://example.com', None]
+
+
+def test_iter_json(teasers, django_assert_num_queries):
+    queryset = Teaser.objects.order_by('pk')
+
+    # The rows and the news targets of the first chunk, the second chunk has no news links
+    with django_assert_num_queries(2):
+        parts = list(iter_json(queryset, 'link', row=lambda teaser: {'title': teaser.title}, chunk_size=2))
+
+    data = json.loads(''.join(parts))
+    assert [row['title'] for row in data] == ['0', '1', '2', '3']
+    assert data[0]['link']['label'] == 'Contact'
+    assert data[3]['link']['href'] is None
+
+
+def test_write_json(teasers):
+    stream = io.StringIO()
+    write_json(stream, Teaser.objects.none(), 'link')
+
+    assert stream.getvalue() == '[]'
@@ -0,0 +1,59 @@
+import pytest
+from django.utils import translation
+
+from linkit.link import Link
+from tests.testapp.models import SnapshotTeaser
+
+pytestmark = pytest.mark.django_db
+
+
+def test_snapshot_is_taken_on_save(news, django_assert_num_queries):
+    SnapshotTeaser.objects.create(link=Link.build(type='news', target=news))
+
+    teaser = SnapshotTeaser.objects.get()
+    assert teaser.link.data('snapshot')['en']['href'] == news.get_absolute_url()
+    with django_assert_num_queries(0):
+        assert teaser.link.href == news.get_absolute_url()
+        assert teaser.link.label == 'Contact'
+
+
+def test_changing_the_link_drops_the_snapshot(news, other_news):
+    SnapshotTeaser.objects.create(link=Link.build(type='news', target=news))
+
+    teaser = SnapshotTeaser.objects.get()
+    teaser.link.set_data('value', {'model': other_news.pk})
+    assert teaser.link.snapshot is None
+    assert teaser.link.href == other_news.get_absolute_url()
+
+
+def test_saving_the_target_refreshes_the_snapshot(news, django_capture_on_commit_callbacks):
+    SnapshotTeaser.objects.create(link=Link.build(type='news', target=news))
+
+    news.title = 'Get in touch'
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        news.save()
+
+    assert len(callbacks) == 1
+    assert SnapshotTeaser.objects.get().link.label == 'Get in touch'
+
+
+def test_snapshots_are_refreshed_on_commit(news, django_capture_on_commit_callbacks):
+    SnapshotTeaser.objects.create(link=Link.build(type='news', target=news))
+
+    news.title = 'Get in touch'
+    with django_capture_on_commit_callbacks() as callbacks:
+        news.save()
+        SnapshotTeaser.objects.create()
+
+    assert len(callbacks) == 1
+    assert SnapshotTeaser.objects.filter(link__isset=True).get().link.label == 'Contact'
+
+
+def test_saving_in_another_language_keeps_the_snapshots(news):
+    SnapshotTeaser.objects.create(link=Link.build(type='news', target=news))
+
+    teaser = SnapshotTeaser.objects.get()
+    with translation.override('de'):
+        teaser.save()
+
+    assert set(SnapshotTeaser.objects.get().link.data('snapshot')) == {'en', 'de'}
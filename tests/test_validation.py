@@ -0,0 +1,31 @@
+import pytest
+
+from linkit.link import Link
+from linkit.types.validation import validate_links
+
+pytestmark = pytest.mark.django_db
+
+
+def test_validate_links(news):
+    links = [
+        Link.build(type='news', target=news),
+        Link.build(type='news', target=news.pk + 1),
+        Link.build(type='file', target=1),
+        Link(config={'types': ['news']}, data={'type': 'input', 'value': {'input': 'https://example.com'}}),
+    ]
+
+    errors = validate_links(links)
+
+    assert [(error.index, error.message) for error in errors] == [
+        (1, 'news {} does not exist'.format(news.pk + 1)),
+        (2, 'file 1 does not exist'),
+        (3, 'Type input is not allowed'),
+    ]
+
+
+def test_public_pages_are_valid(page):
+    page.publish('en')
+    public = page.get_public_object()
+
+    assert validate_links([Link.build(type='page', target=public.pk)]) == []
+    assert Link.build(type='page', target=public).data('value') == {'page': page.pk}
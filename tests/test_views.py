@@ -0,0 +1,50 @@
+import pytest
+from django.contrib.auth.models import Permission
+from django.urls import reverse
+
+from tests.testapp.link_types import NewsLinkType
+from tests.testapp.models import News
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def staff_client(client, django_user_model):
+    user = django_user_model.objects.create_user('editor', password='editor', is_staff=True)
+    client.force_login(user)
+    client.user = user
+    return client
+
+
+def search(client, term=''):
+    return client.get(reverse('linkit:search', kwargs={'identifier': 'news'}), {'term': term})
+
+
+def test_search(admin_client, news, other_news):
+    response = search(admin_client, 'imp')
+
+    assert response.status_code == 200
+    assert response.json() == {'results': [{'id': str(other_news.pk), 'text': 'Imprint'}],
+                               'pagination': {'more': False}}
+
+
+def test_search_requires_the_view_permission(staff_client, news):
+    assert search(staff_client).status_code == 403
+
+    staff_client.user.user_permissions.add(Permission.objects.get(codename='view_news'))
+    assert search(staff_client).status_code == 200
+
+
+def test_search_without_search_fields(admin_client, news, other_news, monkeypatch):
+    monkeypatch.setattr(NewsLinkType, 'search_fields', ())
+
+    assert [result['text'] for result in search(admin_client, 'cont').json()['results']] == ['Contact']
+
+
+def test_search_pagination(admin_client, db):
+    News.objects.bulk_create([News(title='News {}'.format(i)) for i in range(25)])
+
+    response = admin_client.get(reverse('linkit:search', kwargs={'identifier': 'news'}), {'term': 'news', 'page': 2})
+
+    assert len(response.json()['results']) == 5
+    assert response.json()['pagination'] == {'more': False}
@@ -0,0 +1,75 @@
+import re
+from html import unescape
+
+import pytest
+
+from linkit.link import Link
+from linkit.scope import request_scope
+from linkit.types.contracts import LinkType
+from tests.testapp.models import Teaser
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def widget():
+    return Teaser._meta.get_field('link').formfield().widget
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    """ Identifiers of the type forms rendered. """
+    rendered = []
+    render = LinkType.render
+
+    def counting_render(self, *args, **kwargs):
+        rendered.append(self.identifier)
+        return render(self, *args, **kwargs)
+
+    monkeypatch.setattr(LinkType, 'render', counting_render)
+    return rendered
+
+
+def link(news, name):
+    return Link.build(type='news', target=news, config=Teaser._meta.get_field('link').config, name=name)
+
+
+def test_all_panels_are_rendered(widget, news, renders):
+    html = widget.render('link', link(news, 'link'))
+
+    assert sorted(renders) == ['file', 'input', 'news', 'page']
+    assert 'data-linkit-panel="' not in html
+    assert 'name="link_link_news-model"' in html
+    assert 'name="link_link_input-input"' in html
+
+
+def test_empty_panels_are_shared_within_a_scope(widget, news, renders):
+    with request_scope():
+        html = [widget.render('teasers-{}-link'.format(i), link(news, 'teasers-{}-link'.format(i))) for i in range(5)]
+
+    # The selected news panel of every row and the empty panels of the other types once
+    assert sorted(renders) == ['file', 'input'] + ['news'] * 5 + ['page']
+    assert 'name="teasers-4-link_link_input-input"' in html[4]
+
+
+def test_lazy_panels(widget, news, renders, settings, admin_client):
+    settings.LINKIT_LAZY_PANELS = True
+    html = widget.render('link', link(news, 'link'))
+
+    assert renders == ['news']
+    urls = dict(re.findall(r'class="linkit_link_(\w+) [^"]*" style="display: none" data-linkit-panel="([^"]+)"', html))
+    assert sorted(urls) == ['file', 'input', 'page']
+
+    response = admin_client.get(unescape(urls['input']))
+    assert response.status_code == 200
+    assert 'name="link_link_input-input"' in response.content.decode()
+
+
+def test_panel_view_rejects_tampered_requests(widget, news, settings, admin_client):
+    settings.LINKIT_LAZY_PANELS = True
+    url = widget.panel_url(link(news, 'link'))
+
+    assert admin_client.get(url + '&type=input').status_code == 200
+    assert admin_client.get(url + '&type=unknown').status_code == 404
+    assert admin_client.get(url.replace('config=', 'config=x') + '&type=input').status_code == 404
+    assert admin_client.get(url.replace('name=link', 'name=%22%3E') + '&type=input').status_code == 404
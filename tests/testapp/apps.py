@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class TestappConfig(AppConfig):
+    name = 'tests.testapp'
+    label = 'testapp'
+
+    def ready(self):
+        from linkit.types import type_manager
+
+        type_manager.register('tests.testapp.link_types.NewsLinkType', identifier='news')
@@ -0,0 +1,10 @@
+from linkit.types.model import ModelLinkType
+
+from tests.testapp.models import News
+
+
+class NewsLinkType(ModelLinkType):
+    identifier = 'news'
+    type_label = 'News'
+    model = News
+    search_fields = ['title']
@@ -0,0 +1,41 @@
+from django.db import models
+
+from linkit.model_fields import LinkField
+from linkit.querysets import LinkManager
+
+
+class News(models.Model):
+    title = models.CharField(max_length=255)
+
+    def __str__(self):
+        return self.title
+
+    def get_absolute_url(self):
+        return '/news/{}/'.format(self.pk)
+
+
+class Teaser(models.Model):
+    title = models.CharField(max_length=255, blank=True)
+    link = LinkField(types=['page', 'file', 'input', 'news'], allow_target=True, allow_no_follow=True, blank=True,
+                     null=True)
+
+    objects = LinkManager()
+
+
+class ProxyTeaser(Teaser):
+    class Meta:
+        proxy = True
+
+
+class ChildTeaser(Teaser):
+    subtitle = models.CharField(max_length=255, blank=True)
+
+
+class SnapshotTeaser(models.Model):
+    link = LinkField(types=['page', 'input', 'news'], snapshot=True, blank=True, null=True)
+
+    objects = LinkManager()
+
+
+class NativeTeaser(models.Model):
+    link = LinkField(types=['page', 'input', 'news'], native_json=True, blank=True, null=True)